@@ -0,0 +1,247 @@
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from game_trace import TRACE_DTYPE, append_traces, trace_file
+from opening_book import book_name
+from pattern_matrix import PatternMatrix
+from scoring_strategies import STRATEGIES
+from word_store import load_word_lists
+from wordle_solver import WordleSolver
+
+FAILED = "X" # histogram bucket for unsolved games
+
+# Per worker process state, set once by init_worker
+worker_words: list[str] = []
+worker_answers: list[str] = []
+worker_max_attempts: int = 6
+worker_candidates_only: bool = False
+worker_solvers: dict = {} # format as {strategy: WordleSolver}
+
+
+def share_word_list(word_list: list[str]) -> shared_memory.SharedMemory:
+    """
+    Copy the word list into shared memory as a fixed width buffer, one byte per letter.
+
+    Parameters:
+    - word_list: The list of words.
+
+    Returns:
+    - shared_words: The shared memory block, unlink it once the pool is done.
+    """
+    packed_words = "".join(word_list).encode("ascii")
+    shared_words = shared_memory.SharedMemory(create=True, size=len(packed_words))
+    shared_words.buf[:len(packed_words)] = packed_words
+    return shared_words
+
+
+def init_worker(shared_name: str, word_count: int, answer_count: int, word_length: int, max_attempts: int, candidates_only: bool = False) -> None:
+    global worker_words, worker_answers, worker_max_attempts, worker_candidates_only
+
+    # the allowed guesses are followed by the possible answers in the shared block
+    shared_words = shared_memory.SharedMemory(name=shared_name)
+    packed_words = bytes(shared_words.buf[:(word_count + answer_count) * word_length]).decode("ascii")
+    shared_words.close()
+
+    worker_max_attempts = max_attempts
+    worker_candidates_only = candidates_only
+    unpacked_words = [packed_words[index:index + word_length] for index in range(0, len(packed_words), word_length)]
+    worker_words = unpacked_words[:word_count]
+    worker_answers = unpacked_words[word_count:]
+
+
+def get_worker_solver(strategy: str) -> WordleSolver:
+    if strategy not in worker_solvers:
+        worker_solvers[strategy] = WordleSolver(strategy=strategy, verbose=False, word_list=worker_words, answer_list=worker_answers, max_attempts=worker_max_attempts, candidates_only=worker_candidates_only)
+    return worker_solvers[strategy]
+
+
+def play_answers(task: tuple[str, str, list[str], bool]) -> tuple[list[tuple[str, bool, int]], np.ndarray | None]:
+    """
+    Play one offline game per answer with the given strategy and opening guess.
+
+    Parameters:
+    - task: A (strategy, opening_guess, answers, trace) tuple.
+
+    Returns:
+    - results: A list of (answer, solved, guesses) tuples.
+    - traces: The games' trace rows when trace is set, else None.
+    """
+    strategy, opening_guess, answers, trace = task
+    solver = get_worker_solver(strategy)
+    solver.opening_guess = opening_guess
+
+    results = []
+    traces = []
+    for answer in answers:
+        solved = solver.startOfflineGame("auto", answer)
+        results.append((answer, solved, solver.attempts))
+        if trace:
+            traces.append(solver.get_trace())
+
+    return results, np.concatenate(traces) if traces else None
+
+
+def run_benchmark(word_list: list[str], answers: list[str], strategies: list[str], opening_guesses: list[str], workers: int = None, trace: bool = False, answer_list: list[str] = None, max_attempts: int = 6, candidates_only: bool = False) -> list[dict]:
+    """
+    Play every answer for each strategy and opening guess across a process pool.
+
+    Parameters:
+    - word_list: The list of words the solver guesses from.
+    - answers: The answers to play against.
+    - strategies: The scoring strategies to compare.
+    - opening_guesses: The first guesses to compare, None lets the strategy choose.
+    - workers: Number of worker processes, defaults to the CPU count.
+    - trace: Also collect every game's trace rows in the report.
+    - answer_list: The possible answers the solver narrows down, the word list if not given.
+    - max_attempts: Guesses allowed per game.
+    - candidates_only: Pattern strategies only score words that can still be the answer.
+
+    Returns:
+    - reports: One report dict per (strategy, opening guess).
+    """
+    workers = workers or os.cpu_count()
+    chunk_size = max(1, len(answers) // (workers * 4))
+    answer_chunks = [answers[start:start + chunk_size] for start in range(0, len(answers), chunk_size)]
+
+    answer_list = answer_list or word_list
+    if any(STRATEGIES[strategy].requires_patterns for strategy in strategies):
+        # built once here when not cached yet, the workers then only memory map the file
+        guesses, possible_answers = load_word_lists(word_list, answer_list)
+        PatternMatrix(guesses, answer_list=possible_answers if possible_answers != guesses else None)
+
+    shared_words = share_word_list(list(word_list) + list(answer_list))
+    reports = []
+    try:
+        with Pool(workers, initializer=init_worker, initargs=(shared_words.name, len(word_list), len(answer_list), len(word_list[0]), max_attempts, candidates_only)) as pool:
+            for strategy in strategies:
+                for opening_guess in opening_guesses:
+                    tasks = [(strategy, opening_guess, chunk, trace) for chunk in answer_chunks]
+
+                    start = time.perf_counter()
+                    chunk_outputs = pool.map(play_answers, tasks)
+                    elapsed = time.perf_counter() - start
+                    results = [result for chunk_results, _ in chunk_outputs for result in chunk_results]
+                    traces = [chunk_traces for _, chunk_traces in chunk_outputs if chunk_traces is not None]
+
+                    reports.append({
+                        "strategy": strategy,
+                        "opening_guess": opening_guess or "auto",
+                        "histogram": Counter(guesses if solved else FAILED for _, solved, guesses in results),
+                        "failures": [answer for answer, solved, _ in results if not solved],
+                        "games_per_sec": len(results) / elapsed,
+                        "games": len(results),
+                        "traces": np.concatenate(traces) if traces else np.zeros(0, dtype=TRACE_DTYPE),
+                    })
+    finally:
+        shared_words.close()
+        shared_words.unlink()
+
+    return reports
+
+
+def print_report(report: dict) -> None:
+    games = report["games"]
+    solved_counts = {guesses: count for guesses, count in report["histogram"].items() if guesses != FAILED}
+    solved = sum(solved_counts.values())
+    average = sum(guesses * count for guesses, count in solved_counts.items()) / solved if solved else 0
+
+    print(f"--- {report['strategy']} / {report['opening_guess']} ---")
+    print(f"Games: {games}  Solved: {solved}  Avg guesses (solved): {average:.3f}  Games/sec: {report['games_per_sec']:.1f}")
+    for guesses in sorted(report["histogram"], key=lambda bucket: (bucket == FAILED, bucket)):
+        count = report["histogram"][guesses]
+        print(f"{guesses:>3}: {count:>6} {'#' * int(50 * count / games)}")
+    if report["failures"]:
+        print(f"Failures ({len(report['failures'])}): {' '.join(report['failures'])}")
+    print()
+
+
+def parse_cmd_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="play the solver offline against every answer in the word list")
+    parser.add_argument(
+        "--strategy",
+        help="scoring strategies to compare",
+        choices=list(STRATEGIES),
+        nargs="+",
+        default=["frequency"]
+    )
+    parser.add_argument(
+        "--start-word",
+        help="opening guesses to compare, the strategy's own choice if not given",
+        nargs="+",
+        default=[None]
+    )
+    parser.add_argument(
+        "--sample",
+        help="play a random sample of this many answers instead of the whole list",
+        type=int
+    )
+    parser.add_argument(
+        "--seed",
+        help="random seed for --sample",
+        type=int,
+        default=0
+    )
+    parser.add_argument(
+        "--workers",
+        help="number of worker processes (default: CPU count)",
+        type=int
+    )
+    parser.add_argument(
+        "--word-length",
+        help="letters per word, reads data/words_<length>.txt for lengths other than 5",
+        type=int,
+        default=5
+    )
+    parser.add_argument(
+        "--max-attempts",
+        help="guesses allowed per game",
+        type=int,
+        default=6
+    )
+    parser.add_argument(
+        "--candidates-only",
+        help="pattern strategies only score words that can still be the answer",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--trace",
+        help="append every game's guesses, patterns and remaining candidates to database/trace_<strategy>_<hash>.bin",
+        action="store_true"
+    )
+    args = parser.parse_args()
+
+    if args.start_word != [None]:
+        word_list, _ = load_word_lists(word_length=args.word_length)
+        args.start_word = [word.lower() for word in args.start_word]
+        for word in args.start_word:
+            if len(word) != args.word_length:
+                parser.error(f"--start-word {word!r} is not {args.word_length} letters long")
+            if word not in word_list:
+                parser.error(f"--start-word {word!r} is not an allowed guess")
+    return args
+
+
+def set_working_directory() -> None:
+    called_py_path = os.path.abspath(__file__)
+    py_dir = os.path.dirname(called_py_path)
+    os.chdir(py_dir)
+
+
+if __name__ == "__main__":
+    set_working_directory()
+    args = parse_cmd_arguments()
+
+    word_list, answer_list = load_word_lists(word_length=args.word_length) # data/answers.txt when present, else every word
+    answers = random.Random(args.seed).sample(answer_list, args.sample) if args.sample else list(answer_list)
+
+    for report in run_benchmark(word_list, answers, args.strategy, args.start_word, args.workers, args.trace, answer_list, args.max_attempts, args.candidates_only):
+        print_report(report)
+        if args.trace:
+            use_patterns = STRATEGIES[report["strategy"]].requires_patterns
+            append_traces(trace_file(book_name(report["strategy"], use_patterns, args.candidates_only), word_list, answer_list), report["traces"])
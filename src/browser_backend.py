@@ -0,0 +1,206 @@
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+import logging
+
+# Everything that talks to the Wordle web page. Only imported once a browser game starts,
+# so offline games, simulations and the solve API never load Selenium.
+
+WORDLE_URL = 'https://www.nytimes.com/games/wordle/index.html'
+
+
+def create_driver(browser: bool = False) -> webdriver.Chrome:
+    """
+    Launch a Chrome session configured for the solver.
+
+    Parameters:
+    - browser: Show the browser window instead of running headless.
+
+    Returns:
+    - driver: The new Chrome session.
+    """
+    # Set the logging level to supress error messages
+    logging.getLogger('selenium').setLevel(logging.CRITICAL)
+
+    # Set the logging level to only show fatal messages
+    chrome_options = Options()
+    if not browser:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("window-size=1900,1080") # required for linux
+
+    chrome_options.add_argument('--log-level=3')
+    chrome_options.add_argument("--incognito")
+    chrome_options.add_argument("--ignore-certificate-errors")
+    chrome_options.add_argument("--no-sandbox")
+
+    return webdriver.Chrome(options=chrome_options)
+
+
+def open_wordle(driver: webdriver.Chrome) -> None:
+    """
+    Load the Wordle page and dismiss the start screens so a new game is ready.
+    """
+    driver.get(WORDLE_URL)
+
+    wait = WebDriverWait(driver, 5)
+
+    play_button = wait.until(EC.presence_of_element_located((By.XPATH, '//button[@type="button" and text()="Play"]')))
+    play_button.click()
+
+    x_button = wait.until(EC.presence_of_element_located((By.XPATH, '//button[@type="button" and @aria-label="Close"]')))
+    x_button.click()
+
+
+ROW_REVEAL_TIMEOUT_MS = 3000
+# Resolves once every tile in the row has a final data-state and has stopped animating.
+# Watches the row with a MutationObserver instead of polling, and returns all tiles in one round trip.
+READ_ROW_SCRIPT = """
+const [rowNumber, timeoutMs, done] = arguments;
+const row = document.querySelector(`div[aria-label="Row ${rowNumber}"]`);
+if (!row) { done(null); return; }
+
+const readTiles = () => Array.from(row.querySelectorAll('div[data-state]'));
+const isRevealed = (tiles) => tiles.length > 0 && tiles.every((tile) =>
+    !['tbd', 'empty'].includes(tile.dataset.state) &&
+    (!tile.dataset.animation || tile.dataset.animation === 'idle'));
+const finish = (tiles) => {
+    observer.disconnect();
+    clearTimeout(timer);
+    done(tiles && tiles.map((tile) => [tile.textContent.trim().toLowerCase(), tile.dataset.state]));
+};
+
+const observer = new MutationObserver(() => {
+    const tiles = readTiles();
+    if (isRevealed(tiles)) finish(tiles);
+});
+const timer = setTimeout(() => finish(null), timeoutMs);
+observer.observe(row, { subtree: true, attributes: true, attributeFilter: ['data-state', 'data-animation'] });
+
+const tiles = readTiles();
+if (isRevealed(tiles)) finish(tiles);
+"""
+
+GUESS_VERIFY_TIMEOUT_MS = 2000
+# Types the whole word and Enter as keyboard events in one call. With verify, waits until the row
+# either starts revealing ("accepted") or the page rejects it with a toast/shake ("rejected: <reason>").
+SUBMIT_GUESS_SCRIPT = """
+const [letters, rowNumber, verify, timeoutMs, done] = arguments;
+const pressKey = (key) => {
+    for (const type of ['keydown', 'keyup']) {
+        document.dispatchEvent(new KeyboardEvent(type, { key: key, bubbles: true }));
+    }
+};
+for (const letter of letters) pressKey(letter);
+pressKey('Enter');
+if (!verify) { done('submitted'); return; }
+
+const row = document.querySelector(`div[aria-label="Row ${rowNumber}"]`);
+const checkRow = () => {
+    const toast = document.querySelector('[class*="Toast-module_toast"]');
+    if (toast && toast.textContent.trim()) {
+        return `rejected: ${toast.textContent.trim()}`;
+    }
+    if (row && /invalid/i.test(row.className)) return 'rejected: invalid word';
+    const tiles = row ? Array.from(row.querySelectorAll('div[data-state]')) : [];
+    const started = tiles.some((tile) => !['tbd', 'empty'].includes(tile.dataset.state) ||
+        (tile.dataset.animation && tile.dataset.animation.startsWith('flip')));
+    return started ? 'accepted' : null;
+};
+const finish = (status) => {
+    observer.disconnect();
+    clearTimeout(timer);
+    done(status);
+};
+
+const observer = new MutationObserver(() => {
+    const status = checkRow();
+    if (status) finish(status);
+});
+const timer = setTimeout(() => finish('timeout'), timeoutMs);
+observer.observe(document.body, { subtree: true, childList: true, attributes: true });
+
+const status = checkRow();
+if (status) finish(status);
+"""
+
+
+def read_row_tiles(driver: webdriver.Chrome, row_number: int) -> list[tuple[str, str]]:
+    """
+    Read the letter and data-state of each tile in a row once it has finished revealing.
+
+    Parameters:
+    - driver: The Chrome session.
+    - row_number: The 1 based Wordle row.
+
+    Returns:
+    - tiles: A list of (letter, data-state) tuples.
+    """
+    tiles = driver.execute_async_script(READ_ROW_SCRIPT, row_number, ROW_REVEAL_TIMEOUT_MS)
+
+    if not tiles:
+        raise Exception(f"Row {row_number} did not finish revealing within {ROW_REVEAL_TIMEOUT_MS}ms")
+    
+    return [(letter, letter_data_state) for letter, letter_data_state in tiles]
+
+
+def submit_guess(driver: webdriver.Chrome, letters: str, row_number: int, verify: bool = False) -> None:
+    """
+    Type a guess into a row and press Enter.
+
+    Parameters:
+    - driver: The Chrome session.
+    - letters: The letters to guess.
+    - row_number: The 1 based Wordle row.
+    - verify: Wait for the row to be accepted, raises ValueError if the page rejects it.
+
+    Returns:
+    None
+    """
+    status = driver.execute_async_script(SUBMIT_GUESS_SCRIPT, letters, row_number, verify, GUESS_VERIFY_TIMEOUT_MS)
+
+    if status.startswith("rejected") or status == "timeout":
+        driver.execute_script(
+            "for (let i = 0; i < arguments[0]; i++) {"
+            "  document.dispatchEvent(new KeyboardEvent('keydown', { key: 'Backspace', bubbles: true }));"
+            "}",
+            len(letters)
+        ) # clear the row so the game can continue
+        raise ValueError(f"Guess {letters} was not accepted ({status})")
+
+
+def read_answer(driver: webdriver.Chrome) -> str:
+    """
+    Read the answer from the toast Wordle shows after the last failed guess.
+    """
+    wait = WebDriverWait(driver, 10)
+    correct_word_element = wait.until(EC.presence_of_element_located((By.XPATH, '//div[@class="Toast-module_toast__iiVsN"]')))
+    return correct_word_element.text
+
+
+class BrowserGame:
+    """
+    A Wordle game in a Chrome session, with the same methods as feedback_oracle.FeedbackOracle.
+
+    Rows are 0 based like the oracle's and converted to Wordle's 1 based row labels here.
+    """
+    def __init__(self, driver: webdriver.Chrome, driver_pool=None, verify: bool = False):
+        self.driver = driver
+        self.driver_pool = driver_pool # the session is released back to it instead of quit
+        self.verify = verify # check each guess was accepted instead of waiting for a timeout
+
+    def submit_guess(self, letters: str, row: int) -> None:
+        submit_guess(self.driver, letters, row + 1, self.verify)
+
+    def get_row(self, row: int) -> list[tuple[str, str]]:
+        return read_row_tiles(self.driver, row + 1)
+
+    def read_answer(self) -> str:
+        return read_answer(self.driver)
+
+    def quit(self) -> None:
+        if self.driver_pool:
+            self.driver_pool.release(self.driver) # keeps the session warm for the next game
+        elif self.driver.service.is_connectable():
+            self.driver.quit()
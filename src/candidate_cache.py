@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+CACHE_MAX_ENTRIES = 4096
+CACHE_MAX_BYTES = 64 * 1024 * 1024 # candidate arrays for the first guesses are the largest entries
+
+
+class CandidateEntry(NamedTuple):
+    candidates: np.ndarray # indices into the answer list left after the history
+    guess: str | None # next guess chosen for the history, None when only the candidates were needed
+
+
+class CandidateCache:
+    """
+    Thread safe LRU cache of feedback history key -> CandidateEntry, bounded by entry count and array bytes.
+
+    Keys are opening_book.history_key() strings, so every history shares the entries of its prefixes.
+    """
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict() # format as {history key: CandidateEntry}, least recently used first
+        self.size_bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> CandidateEntry | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def longest_prefix(self, keys: list[str]) -> tuple[int, CandidateEntry | None]:
+        """
+        Find the longest cached history prefix, counted as a single hit or miss.
+
+        Parameters:
+        - keys: The history key of every prefix, shortest first.
+
+        Returns:
+        - (length, entry): The prefix length and its entry, (0, None) if no prefix is cached.
+        """
+        with self.lock:
+            for length in range(len(keys), 0, -1):
+                entry = self.entries.get(keys[length - 1])
+                if entry is not None:
+                    self.entries.move_to_end(keys[length - 1])
+                    self.hits += 1
+                    return length, entry
+            self.misses += 1
+            return 0, None
+
+    def put(self, key: str, entry: CandidateEntry) -> None:
+        entry.candidates.setflags(write=False) # shared between games and threads from now on
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous.candidates.nbytes
+                if entry.guess is None: # same history, same candidates, keep the guess already chosen
+                    entry = entry._replace(guess=previous.guess)
+            self.entries[key] = entry
+            self.size_bytes += entry.candidates.nbytes
+            while len(self.entries) > self.max_entries or (self.size_bytes > self.max_bytes and len(self.entries) > 1):
+                _, evicted = self.entries.popitem(last=False)
+                self.size_bytes -= evicted.candidates.nbytes
+                self.evictions += 1
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "bytes": self.size_bytes,
+            "hit_rate": self.hit_rate(),
+        }
+
+    def __len__(self) -> int:
+        return len(self.entries)
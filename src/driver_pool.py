@@ -0,0 +1,122 @@
+from selenium import webdriver
+from browser_backend import create_driver, open_wordle
+import queue
+import threading
+import time
+
+
+class WebDriverPool:
+    """
+    Keeps up to `size` warm Chrome sessions so back to back games skip the browser cold start.
+
+    acquire() hands out a session sitting on a fresh game, release() wipes the game state and
+    reloads the page so the session can be reused.
+    """
+    def __init__(self, size: int = 1, browser: bool = False):
+        self.size = size
+        self.browser = browser
+        self.idle_drivers = queue.Queue()
+        self.drivers = set() # every live session, idle or handed out
+        self.starting = 0 # sessions being launched, counted against size
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def acquire(self, timeout: float = None) -> webdriver.Chrome:
+        """
+        Get a healthy session with a new game open.
+
+        Parameters:
+        - timeout: Seconds to wait for a session when all of them are in use, None waits forever.
+
+        Returns:
+        - driver: The Chrome session.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                if self.closed:
+                    raise RuntimeError("Driver pool is closed")
+                can_create = self.idle_drivers.empty() and len(self.drivers) + self.starting < self.size
+                if can_create:
+                    self.starting += 1 # reserve the slot while Chrome starts
+
+            if can_create:
+                return self.start_driver()
+
+            try:
+                driver = self.idle_drivers.get(timeout=1) # wake up regularly in case a discarded slot frees up
+            except queue.Empty:
+                if deadline and time.monotonic() > deadline:
+                    raise TimeoutError("No browser session became available")
+                continue
+
+            if self.is_healthy(driver):
+                return driver
+            self.discard(driver)
+
+    def start_driver(self) -> webdriver.Chrome:
+        driver = None
+        try:
+            driver = create_driver(self.browser)
+            open_wordle(driver)
+        except:
+            with self.lock:
+                self.starting -= 1
+            if driver:
+                driver.quit()
+            raise
+
+        with self.lock:
+            self.starting -= 1
+            self.drivers.add(driver)
+        return driver
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Reset a session to a new game and return it to the pool, sessions that fail to reset are quit.
+        """
+        if self.closed:
+            self.discard(driver)
+            return
+
+        try:
+            self.reset_game(driver)
+        except Exception:
+            self.discard(driver)
+            return
+        self.idle_drivers.put(driver)
+
+    def reset_game(self, driver: webdriver.Chrome) -> None:
+        # Wordle keeps the board in storage, clearing it and reloading starts a fresh game
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        open_wordle(driver)
+
+    def is_healthy(self, driver: webdriver.Chrome) -> bool:
+        try:
+            return driver.execute_script("return document.readyState") == "complete"
+        except Exception:
+            return False
+
+    def discard(self, driver: webdriver.Chrome) -> None:
+        with self.lock:
+            self.drivers.discard(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """
+        Quit every session, including ones still handed out.
+        """
+        with self.lock:
+            self.closed = True
+            drivers = list(self.drivers)
+            self.drivers.clear()
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,68 @@
+class FeedbackOracle:
+    """
+    In-process stand-in for the Wordle web page.
+
+    Scores guesses against a known answer and exposes each row as (letter, data-state)
+    pairs, the same tile data the solver reads from the browser. Same methods as
+    browser_backend.BrowserGame, so the solver plays both the same way.
+    """
+    def __init__(self, answer: str):
+        self.answer = answer
+        self.rows = [] # format as [[(letter, data-state)]]
+
+    def score_guess(self, guess: str) -> list[str]:
+        """
+        Score a guess against the answer with Wordle's duplicate letter rules.
+
+        Parameters:
+        - guess: The guessed word.
+
+        Returns:
+        - letter_states: The data-state of each tile.
+        """
+        letter_states = ['absent'] * len(guess)
+        unmatched_letters = []
+
+        for position, (guess_letter, answer_letter) in enumerate(zip(guess, self.answer)):
+            if guess_letter == answer_letter:
+                letter_states[position] = 'correct'
+            else:
+                unmatched_letters.append(answer_letter)
+
+        for position, guess_letter in enumerate(guess):
+            if letter_states[position] != 'correct' and guess_letter in unmatched_letters:
+                letter_states[position] = 'present'
+                unmatched_letters.remove(guess_letter)
+
+        return letter_states
+
+    def submit_guess(self, letters: str, row: int) -> None:
+        """
+        Submit a guess and reveal its row.
+
+        Parameters:
+        - letters: The letters to guess.
+        - row: The row number (0 based), rows are revealed in order.
+
+        Returns:
+        None
+        """
+        self.rows.append(list(zip(letters, self.score_guess(letters))))
+
+    def get_row(self, row: int) -> list[tuple[str, str]]:
+        """
+        Get the revealed tiles of a row (0 based).
+
+        Parameters:
+        - row: The row number.
+
+        Returns:
+        - tiles: A list of (letter, data-state) tuples.
+        """
+        return self.rows[row]
+
+    def read_answer(self) -> str:
+        return self.answer
+
+    def quit(self) -> None:
+        self.rows = []
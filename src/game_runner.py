@@ -0,0 +1,168 @@
+import argparse
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from candidate_cache import CandidateCache
+from driver_pool import WebDriverPool
+from stats_manager import BufferedStatsWriter, WordleStats, open_stats
+from wordle_solver import WordleSolver
+
+
+def play_one_game(solver: WordleSolver, mode: str, driver_pool: WebDriverPool) -> list:
+    # runs on a worker thread, every Selenium call in here blocks
+    solver.startGame(mode, driver_pool=driver_pool)
+    return solver.get_results()
+
+
+def is_complete(results: list) -> bool:
+    # startGame swallows crashes and leaves an empty answer and 0 guesses behind
+    _, _, answer, _, guesses = results
+    return answer != "" and guesses != 0
+
+
+class ConcurrentGameRunner:
+    """
+    Plays browser games on K Chrome sessions at once.
+
+    The Selenium calls run on a thread pool behind an asyncio front end that applies a timeout and
+    retries per game. Results go through one queue to a single writer so the stats file stays consistent.
+    """
+    def __init__(self, stats: WordleStats, sessions: int = 4, browser: bool = False, timeout: float = 120, retries: int = 1):
+        self.stats = stats
+        self.sessions = sessions
+        self.timeout = timeout
+        self.retries = retries
+        self.driver_pool = WebDriverPool(sessions, browser)
+        # extra threads so a game stuck past its timeout doesn't starve the retries
+        self.executor = ThreadPoolExecutor(max_workers=sessions * 2)
+        self.candidate_cache = CandidateCache() # thread safe, shared by every session's solver
+        self.failed_games = 0
+
+    async def run(self, game_count: int, mode: str = "rand") -> None:
+        games = asyncio.Queue()
+        for game_number in range(game_count):
+            games.put_nowait(game_number)
+
+        results = asyncio.Queue()
+        writer = asyncio.create_task(self.write_results(results))
+        try:
+            await asyncio.gather(*(self.session_worker(games, results, mode) for _ in range(self.sessions)))
+        finally:
+            await results.put(None) # tells the writer no more results are coming
+            await writer
+            self.driver_pool.close()
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def create_solver(self) -> WordleSolver:
+        # runs on a worker thread, building a solver encodes the whole word list
+        return WordleSolver(verbose=False, candidate_cache=self.candidate_cache)
+
+    async def session_worker(self, games: asyncio.Queue, results: asyncio.Queue, mode: str) -> None:
+        loop = asyncio.get_running_loop()
+        solver = await loop.run_in_executor(self.executor, self.create_solver) # solvers are not thread safe, one per session
+        while not games.empty():
+            game_number = games.get_nowait()
+            game_results, solver = await self.play_with_retries(solver, game_number, mode)
+            if game_results:
+                await results.put(game_results)
+            else:
+                self.failed_games += 1
+
+    async def play_with_retries(self, solver: WordleSolver, game_number: int, mode: str) -> tuple[list | None, WordleSolver]:
+        """
+        Play one game, retrying crashes and timeouts.
+
+        Returns:
+        - (game_results, solver): The results, None if every attempt failed, and the solver for the session's next game.
+        """
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.retries + 1):
+            try:
+                game_results = await asyncio.wait_for(
+                    loop.run_in_executor(self.executor, play_one_game, solver, mode, self.driver_pool),
+                    self.timeout
+                )
+                if is_complete(game_results):
+                    return game_results, solver
+                print(f"Game {game_number} crashed (attempt {attempt + 1})")
+            except asyncio.TimeoutError:
+                print(f"Game {game_number} timed out after {self.timeout}s (attempt {attempt + 1})")
+                if solver.wordle:
+                    # quitting the session makes the stuck Selenium call fail so the thread can finish
+                    self.driver_pool.discard(solver.wordle.driver)
+                # the abandoned game's thread still holds the old solver
+                solver = await loop.run_in_executor(self.executor, self.create_solver)
+        return None, solver
+
+    async def write_results(self, results: asyncio.Queue) -> None:
+        saved_games = 0
+        with BufferedStatsWriter(self.stats) as stats_writer: # batched, the rest is written when the runner stops
+            while True:
+                game_results = await results.get()
+                if game_results is None:
+                    break
+                stats_writer.save_stats_csv(*game_results)
+                saved_games += 1
+                print(f"Recorded game {saved_games}: {game_results}")
+
+
+def parse_cmd_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="play many browser games on several Chrome sessions at once")
+    parser.add_argument(
+        "--games",
+        help="number of games to play",
+        type=int,
+        required=True
+    )
+    parser.add_argument(
+        "--sessions",
+        help="number of concurrent Chrome sessions",
+        type=int,
+        default=4
+    )
+    parser.add_argument(
+        "--mode",
+        help="select game mode",
+        choices=["auto", "rand"],
+        default="rand"
+    )
+    parser.add_argument(
+        "--timeout",
+        help="seconds before a game is abandoned and retried",
+        type=float,
+        default=120
+    )
+    parser.add_argument(
+        "--retries",
+        help="times a crashed or timed out game is retried",
+        type=int,
+        default=1
+    )
+    parser.add_argument(
+        "--browser",
+        help="show the Chrome windows",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--stats",
+        help="stats file in database/, a .db or .sqlite name uses the SQLite backend",
+        default="stats.csv"
+    )
+    return parser.parse_args()
+
+
+def set_working_directory() -> None:
+    called_py_path = os.path.abspath(__file__)
+    py_dir = os.path.dirname(called_py_path)
+    os.chdir(py_dir)
+
+
+if __name__ == "__main__":
+    set_working_directory()
+    args = parse_cmd_arguments()
+
+    runner = ConcurrentGameRunner(open_stats(args.stats), args.sessions, args.browser, args.timeout, args.retries)
+    asyncio.run(runner.run(args.games, args.mode))
+    print(f"--- {args.games - runner.failed_games}/{args.games} games saved ---")
@@ -0,0 +1,116 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from pattern_matrix import words_hash
+
+NOT_FILTERED = -1 # candidate count for guesses taken from the opening book, the list isn't filtered then
+UNKNOWN_WORD = 0xFFFF # word not in the allowed guess list
+# One row per guess, fixed width so traces can be appended to and memory mapped without parsing
+TRACE_DTYPE = np.dtype([
+    ("game", "<u8"), # time.time_ns() when the game was recorded, unique per game and sortable
+    ("step", "u1"), # 0 based guess number
+    ("guess", "<u2"), # index into the allowed guess list
+    ("pattern", "<u2"), # base 3 feedback, see pattern_matrix.pattern_from_states (up to 3 ** 8 codes)
+    ("candidates", "<i4"), # candidates left when the guess was chosen
+    ("answer", "<u2"), # index into the allowed guess list
+])
+
+
+def trace_file(name: str, word_list: list[str], answer_list: list[str] = None, data_dir: str = "../database/") -> str:
+    # word indices only mean something for the word lists they were taken from
+    return os.path.join(data_dir, f"trace_{name}_{words_hash(word_list, answer_list)}.bin")
+
+
+def trace_rows(guess_history: list[tuple[str, int]], candidate_counts: list[int], answer: str, word_index: dict[str, int], game: int = None) -> np.ndarray:
+    """
+    Pack one game into trace rows.
+
+    Parameters:
+    - guess_history: The game's (guess, pattern) list.
+    - candidate_counts: Candidates left before each guess, NOT_FILTERED when unknown.
+    - answer: The game's answer.
+    - word_index: A dictionary (or WordIndex) of {word: index in the allowed guess list}.
+    - game: Game id, defaults to the current time in ns.
+
+    Returns:
+    - rows: A TRACE_DTYPE array with one row per guess.
+    """
+    rows = np.zeros(len(guess_history), dtype=TRACE_DTYPE)
+    rows["game"] = time.time_ns() if game is None else game
+    rows["step"] = np.arange(len(guess_history))
+    rows["guess"] = [word_index.get(guess, UNKNOWN_WORD) for guess, _ in guess_history]
+    rows["pattern"] = [pattern for _, pattern in guess_history]
+    rows["candidates"] = candidate_counts
+    rows["answer"] = word_index.get(answer.lower(), UNKNOWN_WORD)
+    return rows
+
+
+def append_traces(file: str, rows: np.ndarray) -> None:
+    # single write of whole records, so concurrent appends don't interleave within a game
+    os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
+    with open(file, "ab") as trace_bin:
+        trace_bin.write(rows.astype(TRACE_DTYPE, copy=False).tobytes())
+
+
+def load_traces(file: str) -> np.ndarray:
+    """
+    Memory map a trace file, a trailing partial record from an interrupted write is ignored.
+    """
+    record_count = os.path.getsize(file) // TRACE_DTYPE.itemsize
+    if record_count == 0:
+        return np.zeros(0, dtype=TRACE_DTYPE)
+    return np.memmap(file, dtype=TRACE_DTYPE, mode="r", shape=(record_count,))
+
+
+def narrowing_summary(traces: np.ndarray) -> list[dict]:
+    """
+    Candidates left at each step, to show where the solver stops narrowing.
+
+    Returns:
+    - summary: One dict per step with the games that reached it and their mean/median/max candidates.
+    """
+    summary = []
+    for step in np.unique(traces["step"]):
+        counts = traces["candidates"][(traces["step"] == step) & (traces["candidates"] != NOT_FILTERED)]
+        summary.append({
+            "step": int(step),
+            "games": int(np.count_nonzero(traces["step"] == step)),
+            "mean": float(counts.mean()) if len(counts) else None,
+            "median": float(np.median(counts)) if len(counts) else None,
+            "max": int(counts.max()) if len(counts) else None,
+        })
+    return summary
+
+
+def parse_cmd_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="summarise a game trace file written with --trace")
+    parser.add_argument("file", help="trace file in database/")
+    return parser.parse_args()
+
+
+def set_working_directory() -> None:
+    called_py_path = os.path.abspath(__file__)
+    py_dir = os.path.dirname(called_py_path)
+    os.chdir(py_dir)
+
+
+if __name__ == "__main__":
+    set_working_directory()
+    args = parse_cmd_arguments()
+
+    file = args.file if os.path.exists(args.file) else f"../database/{args.file}"
+    if not os.path.exists(file):
+        sys.exit(f"Trace file {args.file} not found")
+
+    traces = load_traces(file)
+    print(f"Games: {len(np.unique(traces['game']))}  Guesses: {len(traces)}")
+    print(f"{'step':>4} {'games':>7} {'mean':>9} {'median':>7} {'max':>6}")
+    for step in narrowing_summary(traces):
+        if step["mean"] is None:
+            print(f"{step['step'] + 1:>4} {step['games']:>7} {'book':>9}")
+            continue
+        print(f"{step['step'] + 1:>4} {step['games']:>7} {step['mean']:>9.1f} {step['median']:>7.0f} {step['max']:>6}")
@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Cold import budget per entry point, in a fresh interpreter. NumPy alone is ~100 ms of it.
+IMPORT_BUDGET_MS = {
+    "solver_core": 250,
+    "wordle_solver": 300,
+    "benchmark": 300,
+    "solve_server": 300,
+}
+ALLOWED_PACKAGES = {"numpy"} # third party packages a pure computation run may load
+
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed_ms, "modules": sorted({{name.split(".")[0] for name in sys.modules}})}}))
+"""
+
+
+def measure_import(module: str, repeat: int = 3) -> tuple[float, set[str]]:
+    """
+    Time importing a module in fresh interpreters.
+
+    Parameters:
+    - module: The module name, imported from this directory.
+    - repeat: Interpreters to start, the fastest run is kept so a busy machine doesn't fail the budget.
+
+    Returns:
+    - (ms, packages): The import time and the third party packages it loaded.
+    """
+    local_modules = {file[:-3] for file in os.listdir(".") if file.endswith(".py")}
+    best_ms, loaded = float("inf"), set()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE_SCRIPT.format(module=module)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        best_ms = min(best_ms, result["ms"])
+        loaded = set(result["modules"])
+
+    packages = loaded - set(sys.stdlib_module_names) - local_modules
+    return best_ms, {package for package in packages if not package.startswith("_") and package != "cython_runtime"}
+
+
+def check_budgets(budgets: dict[str, float], repeat: int = 3) -> bool:
+    """
+    Print each module's import time against its budget.
+
+    Returns:
+    - within_budget: True if every module is under budget and loads no package outside ALLOWED_PACKAGES.
+    """
+    within_budget = True
+    print(f"{'module':<16} {'ms':>8} {'budget':>8}  packages")
+    for module, budget_ms in budgets.items():
+        ms, packages = measure_import(module, repeat)
+        extra_packages = packages - ALLOWED_PACKAGES
+        status = "ok" if ms <= budget_ms and not extra_packages else "OVER"
+        within_budget &= status == "ok"
+        print(f"{module:<16} {ms:>8.1f} {budget_ms:>8.0f}  {', '.join(sorted(packages)) or '-'}  {status}")
+        if extra_packages:
+            print(f"  unexpected imports: {', '.join(sorted(extra_packages))}")
+    return within_budget
+
+
+def parse_cmd_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="check the solver entry points import quickly and without Selenium")
+    parser.add_argument(
+        "--repeat",
+        help="fresh interpreters per module, the fastest is kept",
+        type=int,
+        default=3
+    )
+    return parser.parse_args()
+
+
+def set_working_directory() -> None:
+    called_py_path = os.path.abspath(__file__)
+    py_dir = os.path.dirname(called_py_path)
+    os.chdir(py_dir)
+
+
+if __name__ == "__main__":
+    set_working_directory()
+    args = parse_cmd_arguments()
+    sys.exit(0 if check_budgets(IMPORT_BUDGET_MS, args.repeat) else 1)
@@ -0,0 +1,83 @@
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+LATENCY_COLUMNS = ["date", "game_mode", "answer", "attempt", "phase", "ms"]
+
+
+class LatencyTracker:
+    """
+    Records how long each phase of a game takes, per guess.
+
+    Phases recorded by WordleSolver:
+    - driver_start: launching or acquiring the browser session
+    - solve: the whole solve_next_word call
+    - eliminate: filtering the candidates (constraints or pattern matrix)
+    - rate: scoring the remaining candidates
+    - submit: typing the guess
+    - read: reading the revealed row
+    """
+    def __init__(self, file: str = "../database/latency.jsonl"):
+        self.file = file
+        self.timings = [] # format as [(attempt, phase, ms)]
+        self.attempt = 0
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((self.attempt, name, (time.perf_counter() - start) * 1000))
+
+    def reset(self) -> None:
+        self.timings = []
+        self.attempt = 0
+
+    def export(self, results: list) -> int:
+        """
+        Append the game's timings to the latency file as JSON lines, one line per timed phase.
+
+        Parameters:
+        - results: The game's get_results() row, so timings can be matched to the stats.
+
+        Returns:
+        - written: Number of lines written.
+        """
+        date, game_mode, answer, _, _ = results
+        lines = [
+            json.dumps(dict(zip(LATENCY_COLUMNS, (date, game_mode, answer, attempt, phase, round(ms, 3)))))
+            for attempt, phase, ms in self.timings
+        ]
+        if not lines:
+            return 0
+
+        os.makedirs(os.path.dirname(self.file) or ".", exist_ok=True)
+        with open(self.file, "a") as latency_file:
+            latency_file.write("\n".join(lines) + "\n")
+        return len(lines)
+
+    def summary(self) -> dict[str, float]:
+        # format as {phase: total ms}
+        totals = {}
+        for _, phase, ms in self.timings:
+            totals[phase] = totals.get(phase, 0) + ms
+        return totals
+
+
+def timed_phase(name: str):
+    """
+    Time a WordleSolver method as `name` when the solver has a latency tracker, a no-op otherwise.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.latency:
+                return method(self, *args, **kwargs)
+            self.latency.attempt = self.attempts
+            with self.latency.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
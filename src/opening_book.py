@@ -0,0 +1,171 @@
+import argparse
+import copy
+import json
+import os
+import time
+
+from feedback_oracle import FeedbackOracle
+from pattern_matrix import pattern_from_states, solved_pattern, states_from_pattern, words_hash
+from scoring_strategies import STRATEGIES
+
+# Bump whenever candidate filtering or guess scoring changes the guesses a solver makes, books of another version are ignored
+BOOK_VERSION = 2
+
+
+def history_key(guess_history: list[tuple[str, int]]) -> str:
+    """
+    Canonical book key for a feedback history, e.g. "crane:10|plots:52".
+    """
+    return "|".join(f"{guess}:{pattern}" for guess, pattern in guess_history)
+
+
+def book_name(strategy: str, use_patterns: bool, candidates_only: bool = False) -> str:
+    """
+    Name of the decision tree a solver configuration follows, the filter and guess pool change which guesses it makes.
+    """
+    name = f"{strategy}-patterns" if use_patterns else strategy
+    if candidates_only and STRATEGIES[strategy].requires_patterns:
+        name += "-candidates"
+    return name
+
+
+def book_file(name: str, word_list: list[str], answer_list: list[str] = None, data_dir: str = "../data/") -> str:
+    return os.path.join(data_dir, f"book_{name}_{words_hash(word_list, answer_list)}.json")
+
+
+def snapshot(solver: "WordleSolver") -> tuple:
+    return (
+        copy.deepcopy((solver.incorrect_letters, solver.correct_letters, solver.wrong_position_letters, solver.constraints)),
+        list(solver.word_list),
+        list(solver.guess_history),
+        (list(solver.candidate_counts), solver.candidate_count),
+    )
+
+
+def restore(solver: "WordleSolver", state: tuple) -> None:
+    letter_status, word_list, guess_history, (candidate_counts, candidate_count) = state
+    solver.incorrect_letters, solver.correct_letters, solver.wrong_position_letters, solver.constraints = copy.deepcopy(letter_status)
+    solver.word_list = list(word_list)
+    solver.guess_history = list(guess_history)
+    solver.candidate_counts = list(candidate_counts)
+    solver.candidate_count = candidate_count
+
+
+def build_book(solver: "WordleSolver") -> dict[str, str]:
+    """
+    Walk the solver's full decision tree and record the guess it makes for every reachable history.
+
+    Each node solves once, then splits the remaining candidates by the feedback they would give,
+    so histories shared by many answers are only solved once.
+
+    Parameters:
+    - solver: The solver to record, with its strategy and filters already configured.
+
+    Returns:
+    - book: A dictionary of {history key: next guess}.
+    """
+    solver.resetGame()
+    solver.book = None # record live decisions only
+    book = {}
+    solved = solved_pattern(solver.word_length)
+    pending = [snapshot(solver)] # format as [solver state]
+
+    while pending:
+        state = pending.pop()
+        restore(solver, state)
+
+        guess = solver.solve_next_word()
+        book[history_key(solver.guess_history)] = guess
+        if len(solver.guess_history) + 1 >= solver.max_attempts:
+            continue
+
+        feedback_groups = {} # format as {pattern: [candidates]}
+        for answer in solver.word_list:
+            pattern = pattern_from_states(FeedbackOracle(answer).score_guess(guess))
+            feedback_groups.setdefault(pattern, []).append(answer)
+
+        parent_state = snapshot(solver)
+        for pattern in feedback_groups:
+            if pattern == solved:
+                continue
+            restore(solver, parent_state)
+            solver.apply_letter_status(list(zip(guess, states_from_pattern(pattern, solver.word_length))))
+            pending.append(snapshot(solver))
+
+    return book
+
+
+def save_book(book: dict[str, str], name: str, word_list: list[str], answer_list: list[str] = None) -> str:
+    file = book_file(name, word_list, answer_list)
+    temp_file = f"{file}.{os.getpid()}.tmp"
+    with open(temp_file, "w") as book_json:
+        json.dump({"name": name, "words": words_hash(word_list, answer_list), "version": BOOK_VERSION, "book": book}, book_json, separators=(",", ":"))
+    os.replace(temp_file, file)
+    return file
+
+
+def load_book(name: str, word_list: list[str], answer_list: list[str] = None, data_dir: str = "../data/") -> dict[str, str] | None:
+    """
+    Load the precomputed book for a solver configuration and word list.
+
+    Parameters:
+    - name: The book name from book_name().
+    - word_list: The allowed guesses the book was built from.
+    - answer_list: The possible answers the book was built from, None if they are the allowed guesses.
+
+    Returns:
+    - book: A dictionary of {history key: next guess}, None if no book was built.
+    """
+    file = book_file(name, word_list, answer_list, data_dir)
+    if not os.path.exists(file):
+        return None
+
+    with open(file, "r") as book_json:
+        saved_book = json.load(book_json)
+    if saved_book["name"] != name or saved_book["words"] != words_hash(word_list, answer_list):
+        return None
+    if saved_book.get("version") != BOOK_VERSION:
+        print(f"Book {file} was built by solver version {saved_book.get('version', 1)}, not {BOOK_VERSION}, and is ignored, rebuild it with opening_book.py")
+        return None
+    return saved_book["book"]
+
+
+def parse_cmd_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="precompute the solver's decision tree for a strategy")
+    parser.add_argument(
+        "--strategy",
+        help="scoring strategy to record",
+        choices=list(STRATEGIES),
+        default="frequency"
+    )
+    parser.add_argument(
+        "--patterns",
+        help="record the pattern matrix filter instead of the letter filters",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--candidates-only",
+        help="pattern strategies only score words that can still be the answer",
+        action="store_true"
+    )
+    return parser.parse_args()
+
+
+def set_working_directory() -> None:
+    called_py_path = os.path.abspath(__file__)
+    py_dir = os.path.dirname(called_py_path)
+    os.chdir(py_dir)
+
+
+if __name__ == "__main__":
+    from wordle_solver import WordleSolver
+
+    set_working_directory()
+    args = parse_cmd_arguments()
+
+    solver = WordleSolver(args.patterns, args.strategy, verbose=False, candidates_only=args.candidates_only)
+    start = time.perf_counter()
+    book = build_book(solver)
+    name = book_name(args.strategy, solver.patterns is not None, args.candidates_only)
+    file = save_book(book, name, list(solver.all_words), list(solver.answers))
+    print(f"Book with {len(book)} positions saved to {file} in {time.perf_counter() - start:.1f}s")
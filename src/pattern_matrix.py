@@ -0,0 +1,197 @@
+import hashlib
+import os
+import sys
+import time
+
+import numpy as np
+
+ABSENT, PRESENT, CORRECT = 0, 1, 2
+LETTER_STATE_CODE = {
+    'absent': ABSENT,
+    'present': PRESENT,
+    'correct': CORRECT
+}
+BUILD_CHUNK_SIZE = 256 # guesses scored per vectorized block
+
+
+def encode_words(word_list: list[str]) -> np.ndarray:
+    """
+    Encode a word list as an (N, word length) uint8 array of letter indices (a=0 ... z=25).
+
+    Parameters:
+    - word_list: The list of words.
+
+    Returns:
+    - codes: The encoded words.
+    """
+    raw = np.frombuffer("".join(word_list).encode("ascii"), dtype=np.uint8)
+    return (raw.reshape(len(word_list), -1) - ord("a")).astype(np.uint8)
+
+
+def words_hash(word_list: list[str], answer_list: list[str] = None) -> str:
+    """
+    Hash a word list, and its separate answer list if any, so cached files are rebuilt when either changes.
+    """
+    words = "\n".join(word_list)
+    if answer_list is not None and tuple(answer_list) != tuple(word_list):
+        words += "\n#answers\n" + "\n".join(answer_list)
+    return hashlib.sha1(words.encode("ascii")).hexdigest()[:16]
+
+
+def pattern_count(word_length: int) -> int:
+    return 3 ** word_length
+
+
+def solved_pattern(word_length: int) -> int:
+    # every digit 2 (correct)
+    return pattern_count(word_length) - 1
+
+
+def pattern_dtype(word_length: int) -> np.dtype:
+    # 3 ** 5 = 243 codes fit a byte, longer words need 16 bits (3 ** 8 = 6561)
+    return np.dtype(np.uint8) if pattern_count(word_length) <= 256 else np.dtype(np.uint16)
+
+
+def pattern_from_states(letter_states: list[str]) -> int:
+    """
+    Convert a row of tile states into its base 3 pattern code.
+
+    Position 0 is the least significant digit, 0 = absent, 1 = present, 2 = correct.
+
+    Parameters:
+    - letter_states: The data-state of each tile in the row.
+
+    Returns:
+    - pattern: The pattern code (0-242 for 5 letter words).
+    """
+    return sum(LETTER_STATE_CODE[state] * 3 ** position for position, state in enumerate(letter_states))
+
+
+def states_from_pattern(pattern: int, word_length: int = 5) -> list[str]:
+    """
+    Convert a base 3 pattern code back into tile states.
+    """
+    code_state = {code: state for state, code in LETTER_STATE_CODE.items()}
+    states = []
+    for _ in range(word_length):
+        pattern, code = divmod(pattern, 3)
+        states.append(code_state[code])
+    return states
+
+
+def compute_patterns(guess_codes: np.ndarray, answer_codes: np.ndarray) -> np.ndarray:
+    """
+    Compute the feedback pattern for every (guess, answer) pair.
+
+    Duplicate letters follow Wordle's rules: greens are assigned first, then each
+    remaining guess letter is yellow only while unmatched copies remain in the answer.
+
+    Parameters:
+    - guess_codes: (G, L) encoded guesses.
+    - answer_codes: (A, L) encoded answers.
+
+    Returns:
+    - patterns: (G, A) matrix of pattern codes, uint8 up to 5 letters and uint16 above.
+    """
+    word_length = guess_codes.shape[1]
+    dtype = pattern_dtype(word_length)
+    guesses = guess_codes[:, None, :]
+    answers = answer_codes[None, :, :]
+
+    green = guesses == answers # (G, A, L)
+    patterns = np.zeros((len(guess_codes), len(answer_codes)), dtype=dtype)
+
+    for position in range(word_length):
+        letter = guesses[:, :, position]
+        # unmatched copies of this letter left in the answer
+        available = ((answers == letter[:, :, None]) & ~green).sum(axis=2)
+        # earlier non-green copies of the same letter in the guess claim yellows first
+        used = np.zeros_like(available)
+        for previous in range(position):
+            used += (guesses[:, :, previous] == letter) & ~green[:, :, previous]
+
+        digit = np.where(green[:, :, position], CORRECT, np.where(available > used, PRESENT, ABSENT))
+        patterns += (digit * 3 ** position).astype(dtype)
+
+    return patterns
+
+
+class PatternMatrix:
+    """
+    Feedback pattern of every allowed guess (rows) against every possible answer (columns).
+    """
+    def __init__(self, word_list: list[str], cache_dir: str = "../data/", answer_list: list[str] = None):
+        self.word_list = word_list
+        self.answer_list = answer_list if answer_list is not None else word_list
+        self.word_index = {word: index for index, word in enumerate(word_list)} # format as {word: row}
+        self.codes = encode_words(word_list)
+        self.word_length = self.codes.shape[1]
+        self.answer_codes = self.codes if answer_list is None else encode_words(self.answer_list)
+        self.file = os.path.join(cache_dir, f"patterns_{words_hash(word_list, answer_list)}.npy")
+
+        missing_answers = [answer for answer in self.answer_list if answer not in self.word_index]
+        if missing_answers:
+            raise ValueError(f"Answers missing from the guess list: {missing_answers[:5]}")
+        self.answer_rows = np.array([self.word_index[answer] for answer in self.answer_list], dtype=np.int64) # guess row of each answer
+
+        if not os.path.exists(self.file):
+            self.build()
+
+        self.matrix = np.load(self.file, mmap_mode="r")
+
+    def build(self) -> None:
+        """
+        Compute the full guess x answer matrix and write it to the cache file.
+
+        Rows are written block by block into an on-disk .npy so the build never holds
+        more than one chunk of intermediates in memory.
+        """
+        word_count = len(self.word_list)
+        temp_file = f"{self.file}.{os.getpid()}.tmp"
+        matrix = np.lib.format.open_memmap(temp_file, mode="w+", dtype=pattern_dtype(self.word_length), shape=(word_count, len(self.answer_list)))
+
+        for start in range(0, word_count, BUILD_CHUNK_SIZE):
+            stop = min(start + BUILD_CHUNK_SIZE, word_count)
+            matrix[start:stop] = compute_patterns(self.codes[start:stop], self.answer_codes)
+
+        matrix.flush()
+        del matrix
+        os.replace(temp_file, self.file) # atomic so concurrent loaders never see a partial file
+
+    def row(self, guess: str, candidates: np.ndarray) -> np.ndarray:
+        """
+        Get the patterns a guess produces against each candidate answer.
+
+        Parameters:
+        - guess: The guessed word, computed on the fly if it is not in the word list.
+        - candidates: Column indices of the candidate answers.
+
+        Returns:
+        - patterns: The pattern code per candidate.
+        """
+        if guess in self.word_index:
+            return self.matrix[self.word_index[guess], candidates]
+        return compute_patterns(encode_words([guess]), self.answer_codes[candidates])[0]
+
+    def filter(self, candidates: np.ndarray, guess: str, pattern: int) -> np.ndarray:
+        """
+        Keep the candidates that would have produced this pattern for the guess.
+        """
+        return candidates[self.row(guess, candidates) == pattern]
+
+
+if __name__ == "__main__":
+    # Build step: python pattern_matrix.py [path/to/words.txt] [path/to/answers.txt]
+    from word_store import load_word_lists, read_source_words
+
+    called_py_path = os.path.abspath(__file__)
+    os.chdir(os.path.dirname(called_py_path))
+    words_file = sys.argv[1] if len(sys.argv) > 1 else "../data/words.txt"
+    answers_file = sys.argv[2] if len(sys.argv) > 2 else "../data/answers.txt"
+
+    answer_list = read_source_words(answers_file) if os.path.exists(answers_file) else None
+    word_list, answer_list = load_word_lists(read_source_words(words_file), answer_list)
+
+    start = time.perf_counter()
+    patterns = PatternMatrix(word_list, os.path.dirname(words_file), answer_list if answer_list != word_list else None)
+    print(f"Pattern matrix ready: {patterns.file} {patterns.matrix.shape} in {time.perf_counter() - start:.1f}s")
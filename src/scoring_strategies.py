@@ -0,0 +1,146 @@
+import numpy as np
+
+from pattern_matrix import PatternMatrix, pattern_count
+
+SCORE_CHUNK_SIZE = 512 # guesses scored per bincount block
+LETTER_COUNT = 26
+
+class ScoringStrategy:
+    name = ""
+    requires_patterns = False
+
+    def rate_candidates(self, candidates: np.ndarray, answer_list: tuple[str, ...], answer_codes: np.ndarray, patterns: PatternMatrix = None) -> tuple[float, str]:
+        """
+        Pick the best next guess from candidate answer indices, the answers are encoded once by the caller.
+
+        Parameters:
+        - candidates: Indices of the remaining candidates in answer_list.
+        - answer_list: Every possible answer.
+        - answer_codes: The answers encoded with encode_words.
+        - patterns: The pattern matrix, required by pattern based strategies.
+
+        Returns:
+        - highest_word_score: A tuple containing the best score and the corresponding word.
+        """
+        raise NotImplementedError("rate_candidates() is not coded.")
+
+
+class FrequencyStrategy(ScoringStrategy):
+    """
+    Scores each candidate by how common its letters are among the remaining candidates.
+
+    - coverage: the share of candidates containing each of the word's distinct letters, summed
+    - positional: the share of candidates with the same letter in each position, summed
+    """
+    name = "frequency"
+
+    def rate_candidates(self, candidates: np.ndarray, answer_list: tuple[str, ...], answer_codes: np.ndarray, patterns: PatternMatrix = None) -> tuple[float, str]:
+        if len(candidates) == 0:
+            return (0,)
+
+        # absent letters are already gone from the candidates, so their frequency is 0 anyway
+        scores = self.score_words(answer_codes[candidates])
+        best = int(np.argmax(scores)) # first highest score, ties go to the earliest word
+        return (float(scores[best]), answer_list[candidates[best]])
+
+    def score_words(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Score an (N, word length) uint8 word array against itself as the candidate set.
+        """
+        word_count, word_length = codes.shape
+
+        contains = np.zeros((word_count, LETTER_COUNT), dtype=bool) # format as [word, letter]
+        contains[np.arange(word_count)[:, None], codes] = True
+        letter_frequency = contains.sum(axis=0) / word_count
+
+        positional_frequency = np.stack([
+            np.bincount(codes[:, position], minlength=LETTER_COUNT) for position in range(word_length)
+        ]) / word_count # format as [position, letter]
+
+        coverage = contains @ letter_frequency # distinct letters only, repeats add nothing
+        positional = positional_frequency[np.arange(word_length), codes].sum(axis=1)
+        return coverage + positional
+
+
+class PatternStrategy(ScoringStrategy):
+    requires_patterns = True
+
+    def __init__(self, probe_guesses: bool = True):
+        self.probe_guesses = probe_guesses # also score allowed guesses that can no longer be the answer, they often split the candidates better
+        self.opening_guess = None # the full list always yields the same first guess
+
+    def score_counts(self, counts: np.ndarray, candidate_count: int) -> np.ndarray:
+        """
+        Score each guess from its (guesses, 3 ** word length) pattern histogram, higher is better.
+        """
+        raise NotImplementedError("score_counts() is not coded.")
+
+    def rate_candidates(self, candidates: np.ndarray, answer_list: tuple[str, ...], answer_codes: np.ndarray, patterns: PatternMatrix = None) -> tuple[float, str]:
+        if patterns is None:
+            raise ValueError(f"The {self.name} strategy needs the pattern matrix.")
+
+        if len(candidates) == 1:
+            return (0, patterns.answer_list[candidates[0]])
+
+        is_full_list = len(candidates) == len(patterns.answer_list)
+        if is_full_list and self.opening_guess:
+            return self.opening_guess
+
+        candidate_rows = patterns.answer_rows[candidates]
+        guesses = np.arange(len(patterns.word_list)) if self.probe_guesses else candidate_rows
+        scores = self.score_guesses(patterns, guesses, candidates)
+
+        # ties go to words that can still be the answer, then to the earliest word
+        is_candidate = np.isin(guesses, candidate_rows)
+        best = np.lexsort((guesses, ~is_candidate, -scores))[0]
+        highest_word_score = (float(scores[best]), patterns.word_list[guesses[best]])
+
+        if is_full_list:
+            self.opening_guess = highest_word_score
+        return highest_word_score
+
+    def score_guesses(self, patterns: PatternMatrix, guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """
+        Score every guess (matrix rows) against the candidate answers (matrix columns) with one bincount per block of guesses.
+        """
+        scores = np.empty(len(guesses), dtype=np.float64)
+        patterns_per_guess = pattern_count(patterns.word_length)
+
+        for start in range(0, len(guesses), SCORE_CHUNK_SIZE):
+            chunk = guesses[start:start + SCORE_CHUNK_SIZE]
+            rows = patterns.matrix[chunk][:, candidates].astype(np.int64)
+            rows += np.arange(len(chunk))[:, None] * patterns_per_guess # offset each guess into its own histogram
+            counts = np.bincount(rows.ravel(), minlength=len(chunk) * patterns_per_guess).reshape(len(chunk), patterns_per_guess)
+            scores[start:start + len(chunk)] = self.score_counts(counts, len(candidates))
+
+        return scores
+
+
+class EntropyStrategy(PatternStrategy):
+    name = "entropy"
+
+    def score_counts(self, counts: np.ndarray, candidate_count: int) -> np.ndarray:
+        probabilities = counts / candidate_count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            information = np.where(counts > 0, -probabilities * np.log2(probabilities), 0)
+        return information.sum(axis=1)
+
+
+class ExpectedRemainingStrategy(PatternStrategy):
+    name = "expected"
+
+    def score_counts(self, counts: np.ndarray, candidate_count: int) -> np.ndarray:
+        return -(counts.astype(np.float64) ** 2).sum(axis=1) / candidate_count
+
+
+class MinimaxStrategy(PatternStrategy):
+    name = "minimax"
+
+    def score_counts(self, counts: np.ndarray, candidate_count: int) -> np.ndarray:
+        return -counts.max(axis=1).astype(np.float64)
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (FrequencyStrategy, EntropyStrategy, ExpectedRemainingStrategy, MinimaxStrategy)
+}
@@ -0,0 +1,315 @@
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from candidate_cache import CACHE_MAX_ENTRIES, CandidateCache, CandidateEntry
+from opening_book import history_key
+from pattern_matrix import pattern_count
+from scoring_strategies import STRATEGIES
+from solver_core import WordDictionary, filter_candidates, rate_candidates
+
+LATENCY_WINDOW = 2048 # most recent requests kept for the latency percentiles
+METRIC_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def parse_history(text: str) -> list[tuple[str, int]]:
+    """
+    Parse a "guess:pattern|guess:pattern" history (commas work too), the format of opening_book.history_key.
+    """
+    history = []
+    for step in text.replace(",", "|").split("|"):
+        if not step:
+            continue
+        guess, _, pattern = step.partition(":")
+        if not pattern.isdigit():
+            raise ValueError(f"Expected guess:pattern, got {step!r}")
+        history.append((guess.strip().lower(), int(pattern)))
+    return history
+
+
+class SolveService:
+    """
+    Answers next guess requests from one shared WordDictionary.
+
+    Candidate sets are cached per history prefix, and concurrent requests that need the same
+    prefix wait for the one request already computing it instead of filtering again.
+    """
+    def __init__(self, dictionary: WordDictionary, cache_size: int = CACHE_MAX_ENTRIES):
+        self.dictionary = dictionary
+        self.cache = CandidateCache(cache_size)
+        self.in_flight = {} # format as {(history key, computation): Future}, work running right now
+        self.lock = threading.Lock()
+        self.coalesced = 0
+
+    def validate(self, history: list[tuple[str, int]]) -> None:
+        for guess, pattern in history:
+            if guess not in self.dictionary.guess_index:
+                raise ValueError(f"{guess!r} is not an allowed guess")
+            if not 0 <= pattern < pattern_count(self.dictionary.word_length):
+                raise ValueError(f"Pattern {pattern} is out of range for {self.dictionary.word_length} letter words")
+
+    def solve(self, history: list[tuple[str, int]]) -> tuple[str, int]:
+        """
+        Get the next guess for a feedback history.
+
+        Returns:
+        - (guess, candidate_count): The next guess and the number of answers still possible.
+        """
+        self.validate(history)
+        if history and history[-1][1] == self.dictionary.solved_pattern:
+            return history[-1][0], 1
+        if not history:
+            return self.dictionary.opening_guess, len(self.dictionary)
+
+        # one cache lookup per request, for the longest prefix of the history already seen
+        keys = [history_key(history[:length]) for length in range(1, len(history) + 1)]
+        start, entry = self.cache.longest_prefix(keys)
+        if start < len(history) or entry.guess is None:
+            entry = self.run_once(keys[-1], self.solve_entry, history, keys, start, entry)
+        return entry.guess, len(entry.candidates)
+
+    def solve_entry(self, history: list[tuple[str, int]], keys: list[str], start: int, entry: CandidateEntry | None) -> CandidateEntry:
+        """
+        Filter the history's steps after the cached prefix and rate the candidates left.
+
+        Parameters:
+        - history: The full feedback history.
+        - keys: The history key of every prefix, shortest first.
+        - start: Length of the cached prefix, 0 if none.
+        - entry: The cached prefix's entry, None if none.
+
+        Returns:
+        - entry: The history's candidates and next guess.
+        """
+        candidates = self.dictionary.all_candidates if entry is None else entry.candidates
+        for step in range(start, len(history)):
+            guess, pattern = history[step]
+            if step == len(history) - 1: # the last step is cached together with its guess by run_once
+                candidates = filter_candidates(self.dictionary, candidates, guess, pattern)
+            else:
+                candidates = self.run_once(keys[step], self.filter_entry, candidates, guess, pattern).candidates
+        return CandidateEntry(candidates, rate_candidates(self.dictionary, candidates))
+
+    def filter_entry(self, candidates: np.ndarray, guess: str, pattern: int) -> CandidateEntry:
+        # a prefix of some request, its own next guess is only rated if it is asked for
+        return CandidateEntry(filter_candidates(self.dictionary, candidates, guess, pattern), None)
+
+    def run_once(self, key: str, compute, *args) -> CandidateEntry:
+        # the first request for a key computes it, concurrent ones wait on its future
+        flight = (key, compute.__name__) # filtering a prefix and solving it are separate results
+        with self.lock:
+            future = self.in_flight.get(flight)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.in_flight[flight] = future
+            else:
+                self.coalesced += 1
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = compute(*args)
+            self.cache.put(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[flight]
+
+
+class ServiceMetrics:
+    def __init__(self):
+        self.latencies = deque(maxlen=LATENCY_WINDOW) # seconds per /solve request
+        self.requests = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float, failed: bool) -> None:
+        with self.lock:
+            self.latencies.append(seconds)
+            self.requests += 1
+            self.errors += failed
+
+    def render(self, service: SolveService) -> str:
+        """
+        Prometheus text format.
+        """
+        with self.lock:
+            latencies = np.array(self.latencies)
+            requests, errors = self.requests, self.errors
+
+        lines = [
+            "# TYPE solve_requests_total counter",
+            f"solve_requests_total {requests}",
+            "# TYPE solve_errors_total counter",
+            f"solve_errors_total {errors}",
+            "# TYPE solve_latency_seconds summary",
+        ]
+        for quantile in METRIC_QUANTILES:
+            value = float(np.quantile(latencies, quantile)) if len(latencies) else 0.0
+            lines.append(f'solve_latency_seconds{{quantile="{quantile}"}} {value:.6f}')
+        lines += [
+            f"solve_latency_seconds_count {len(latencies)}",
+            "# TYPE solve_cache_hits_total counter",
+            f"solve_cache_hits_total {service.cache.hits}",
+            "# TYPE solve_cache_misses_total counter",
+            f"solve_cache_misses_total {service.cache.misses}",
+            "# TYPE solve_cache_hit_rate gauge",
+            f"solve_cache_hit_rate {service.cache.hit_rate():.4f}",
+            "# TYPE solve_cache_evictions_total counter",
+            f"solve_cache_evictions_total {service.cache.evictions}",
+            "# TYPE solve_cache_entries gauge",
+            f"solve_cache_entries {len(service.cache)}",
+            "# TYPE solve_cache_bytes gauge",
+            f"solve_cache_bytes {service.cache.size_bytes}",
+            "# TYPE solve_coalesced_total counter",
+            f"solve_coalesced_total {service.coalesced}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET  /solve?history=tares:0|lingo:51
+    POST /solve  {"history": [["tares", 0], ["lingo", 51]]}
+    GET  /metrics
+    GET  /health
+    """
+    server: "SolveServer"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        match url.path.rstrip("/"):
+            case "/solve":
+                self.handle_solve(lambda: parse_history(parse_qs(url.query).get("history", [""])[0]))
+            case "/metrics":
+                self.send_text(200, self.server.metrics.render(self.server.service), "text/plain; version=0.0.4")
+            case "/health":
+                self.send_json(200, {"status": "ok", "words": len(self.server.service.dictionary)})
+            case _:
+                self.send_json(404, {"error": f"Unknown path {url.path}"})
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path.rstrip("/") != "/solve":
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        def read_history() -> list[tuple[str, int]]:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if not isinstance(body, dict) or not isinstance(body.get("history", []), list):
+                raise ValueError('Expected a JSON object like {"history": [["tares", 0]]}')
+            return [(str(guess).lower(), int(pattern)) for guess, pattern in body.get("history", [])]
+
+        self.handle_solve(read_history)
+
+    def handle_solve(self, read_history) -> None:
+        start = time.perf_counter()
+        failed = True
+        try:
+            history = read_history()
+            guess, candidate_count = self.server.service.solve(history)
+            failed = False
+            solved = bool(history) and history[-1][1] == self.server.service.dictionary.solved_pattern
+            self.send_json(200, {"guess": guess, "candidates": candidate_count, "solved": solved})
+        except (ValueError, TypeError) as err: # bad history, or no answer left for it
+            self.send_json(400, {"error": str(err)})
+        finally:
+            self.server.metrics.record(time.perf_counter() - start, failed)
+
+    def send_json(self, status: int, payload: dict) -> None:
+        self.send_text(status, json.dumps(payload), "application/json")
+
+    def send_text(self, status: int, text: str, content_type: str) -> None:
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SolveServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128 # the socketserver default of 5 resets connections under bursts of concurrent games
+
+    def __init__(self, address: tuple[str, int], service: SolveService, verbose: bool = False):
+        super().__init__(address, SolveRequestHandler)
+        self.service = service
+        self.metrics = ServiceMetrics()
+        self.verbose = verbose
+
+
+def parse_cmd_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="serve next guesses over HTTP")
+    parser.add_argument(
+        "--host",
+        help="address to listen on",
+        default="127.0.0.1"
+    )
+    parser.add_argument(
+        "--port",
+        help="port to listen on",
+        type=int,
+        default=8600
+    )
+    parser.add_argument(
+        "--strategy",
+        help="scoring strategy used for every request",
+        choices=list(STRATEGIES),
+        default="frequency"
+    )
+    parser.add_argument(
+        "--candidates-only",
+        help="pattern strategies only score words that can still be the answer",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--cache-size",
+        help="history prefixes whose candidate sets are kept",
+        type=int,
+        default=CACHE_MAX_ENTRIES
+    )
+    parser.add_argument(
+        "--verbose",
+        help="log every request",
+        action="store_true"
+    )
+    return parser.parse_args()
+
+
+def set_working_directory() -> None:
+    called_py_path = os.path.abspath(__file__)
+    py_dir = os.path.dirname(called_py_path)
+    os.chdir(py_dir)
+
+
+if __name__ == "__main__":
+    set_working_directory()
+    args = parse_cmd_arguments()
+
+    service = SolveService(WordDictionary(strategy=args.strategy, candidates_only=args.candidates_only), args.cache_size)
+    server = SolveServer((args.host, args.port), service, args.verbose)
+    print(f"Solve server listening on http://{args.host}:{args.port} ({args.strategy})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,106 @@
+import numpy as np
+
+from pattern_matrix import PatternMatrix, compute_patterns, encode_words, solved_pattern
+from scoring_strategies import STRATEGIES
+from word_store import WordIndex, load_word_lists
+
+
+class WordDictionary:
+    """
+    Read-only, pre-encoded word lists and scoring setup shared by every solve() call.
+
+    Nothing here changes after construction, so one instance can serve many games or threads at once.
+    """
+    def __init__(self, word_list: list[str] = None, answer_list: list[str] = None, strategy: str = "frequency", use_patterns: bool = False, word_length: int = None, candidates_only: bool = False):
+        self.guesses, self.answers = load_word_lists(word_list, answer_list, word_length)
+        self.word_length = len(self.guesses[0])
+        self.solved_pattern = solved_pattern(self.word_length)
+        self.guess_index = WordIndex(self.guesses)
+        self.answer_codes = encode_words(self.answers)
+        self.answer_codes.setflags(write=False)
+        self.all_candidates = np.arange(len(self.answers))
+        self.all_candidates.setflags(write=False)
+
+        self.strategy_name = strategy
+        self.strategy = STRATEGIES[strategy]()
+        has_answer_list = self.answers != self.guesses
+        if candidates_only and self.strategy.requires_patterns:
+            self.strategy.probe_guesses = False
+        use_patterns = use_patterns or self.strategy.requires_patterns
+        self.patterns = PatternMatrix(self.guesses, answer_list=self.answers if has_answer_list else None) if use_patterns else None
+
+        # solved once up front, the strategy's opening cache is never written to afterwards
+        self.opening_guess: str = rate_candidates(self, self.all_candidates)
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+
+def filter_candidates(dictionary: WordDictionary, candidates: np.ndarray, guess: str, pattern: int) -> np.ndarray:
+    """
+    Keep the candidates that would have produced this pattern for the guess.
+
+    Parameters:
+    - dictionary: The shared word dictionary.
+    - candidates: Indices of the remaining candidates in dictionary.answers.
+    - guess: The guessed word.
+    - pattern: Its base 3 feedback pattern.
+
+    Returns:
+    - candidates: The indices that are still possible.
+    """
+    if dictionary.patterns:
+        return dictionary.patterns.filter(candidates, guess, pattern)
+    guess_patterns = compute_patterns(encode_words([guess]), dictionary.answer_codes[candidates])[0]
+    return candidates[guess_patterns == pattern]
+
+
+def find_candidates(dictionary: WordDictionary, history: list[tuple[str, int]], candidates: np.ndarray = None) -> np.ndarray:
+    """
+    Narrow the possible answers down with a feedback history.
+
+    Parameters:
+    - dictionary: The shared word dictionary.
+    - history: A list of (guess, pattern) tuples, patterns as base 3 ints.
+    - candidates: Candidates to start from, every answer if not given.
+
+    Returns:
+    - candidates: Indices into dictionary.answers. Each step allocates the guess's patterns against the candidates,
+      a match mask and the narrowed indices, all sized by the candidates left; the dictionary's arrays are never copied.
+    """
+    candidates = dictionary.all_candidates if candidates is None else candidates
+    for guess, pattern in history:
+        if len(guess) != dictionary.word_length:
+            raise ValueError(f"Guess {guess} is not {dictionary.word_length} letters long")
+        candidates = filter_candidates(dictionary, candidates, guess.lower(), int(pattern))
+    return candidates
+
+
+def rate_candidates(dictionary: WordDictionary, candidates: np.ndarray) -> str:
+    """
+    Pick the next guess for a set of candidates with the dictionary's scoring strategy.
+    """
+    if len(candidates) == 0:
+        raise ValueError("No word matches the feedback history")
+    return dictionary.strategy.rate_candidates(candidates, dictionary.answers, dictionary.answer_codes, dictionary.patterns)[1]
+
+
+def solve(dictionary: WordDictionary, history: list[tuple[str, int]]) -> str:
+    """
+    Get the next guess for a feedback history.
+
+    A pure function of its arguments: nothing is stored between calls, so the same
+    dictionary can be shared by any number of concurrent games.
+
+    Parameters:
+    - dictionary: The shared word dictionary.
+    - history: A list of (guess, pattern) tuples, patterns as base 3 ints (see pattern_matrix.pattern_from_states).
+
+    Returns:
+    - guess: The next guess, the solved word once the last pattern is all correct.
+    """
+    if history and int(history[-1][1]) == dictionary.solved_pattern:
+        return history[-1][0].lower()
+    if not history:
+        return dictionary.opening_guess
+    return rate_candidates(dictionary, find_candidates(dictionary, history))
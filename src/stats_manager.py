@@ -1,7 +1,53 @@
 import csv
+import signal
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError: # Windows, appends from concurrent processes aren't locked there
+    fcntl = None
+
+SQLITE_SUFFIXES = (".db", ".sqlite")
+FLUSH_ROWS = 500 # buffered results written per batch
+FLUSH_SECONDS = 5.0 # oldest buffered result is written after this long, by a timer thread if no save comes first
+DEFERRED_SIGNALS = {signal.SIGINT, signal.SIGTERM} # held back while a batch is written, their handlers flush and exit
+
+
+@contextmanager
+def locked_file(file, exclusive: bool = True):
+    # advisory lock held for one batch, so appends from concurrent runners never interleave
+    if fcntl is None:
+        yield file
+        return
+    fcntl.flock(file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    try:
+        yield file
+    finally:
+        fcntl.flock(file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def signals_deferred():
+    # handlers that flush and exit would cut a batch short or write it twice, they run once it is written
+    if threading.current_thread() is not threading.main_thread():
+        yield # handlers only run on the main thread, which waits for this batch on the writer's lock
+        return
+    received = []
+    previous = {sig: signal.signal(sig, lambda sig_num, frame: received.append(sig_num)) for sig in DEFERRED_SIGNALS}
+    try:
+        yield
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler if handler is not None else signal.SIG_DFL)
+        for sig_num in received:
+            signal.raise_signal(sig_num)
+
 class WordleStats:
     def __init__(self, filename: str):
         self.file = f"../database/{filename}" # Make sure to include .csv at end of file name
@@ -15,13 +61,30 @@ class WordleStats:
             output_file.write_text("date;game_mode;answer;solved;guesses\n")
 
     def save_stats_csv(self, date: str, game_mode: str, answer: str, solved: bool, guesses: int):
-        if self.check_valid_stats(guesses, answer):
-            with open(self.file, "a", newline="") as stats_file: # unable to read with "a" append 
-                writer = csv.writer(stats_file, delimiter=";")
-                row_data: list = [date, game_mode, answer, solved, guesses]
-                writer.writerow(row_data)
+        self.save_many([(date, game_mode, answer, solved, guesses)])
+
+    def save_many(self, rows: list[tuple[str, str, str, bool, int]]) -> int:
+        """
+        Append many results with one open and one locked write.
+
+        Parameters:
+        - rows: A list of (date, game_mode, answer, solved, guesses) tuples.
+
+        Returns:
+        - saved: The number of valid rows written.
+        """
+        valid_rows = [list(row) for row in rows if self.check_valid_stats(int(row[4]), row[2])]
+        if not valid_rows:
+            return 0
+        with open(self.file, "a", newline="") as stats_file, locked_file(stats_file): # unable to read with "a" append 
+            writer = csv.writer(stats_file, delimiter=";")
+            writer.writerows(valid_rows)
+            stats_file.flush()
+        return len(valid_rows)
           
     def get_answer(self, date: str = None) -> str:
+        # no date returns the most recent answer
+        answer = None
         with open(self.file, "r", newline="") as stats_file:
             reader = csv.reader(stats_file, delimiter=";")
             next(reader)
@@ -30,7 +93,8 @@ class WordleStats:
                     if row[0] == date:
                         return row[2]
                 else:
-                    return row[2]
+                    answer = row[2]
+        return answer
                 
     def check_valid_stats(self, guesses: int, answer: str) -> bool:
         ## 2024-05-14;rand;;False;0
@@ -45,7 +109,178 @@ class WordleStats:
     def get_file(self):
         return self.file
 
+class SQLiteStats(WordleStats):
+    """
+    Stats stored in an indexed SQLite database, same methods as the CSV backed WordleStats.
+
+    WAL mode lets several game runners write while the dashboard reads.
+    """
+    def __init__(self, filename: str):
+        self.connection = None
+        super().__init__(filename)
+
+    def get_connection(self) -> sqlite3.Connection:
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.file, timeout=30, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+        return self.connection
+
+    def create_headers(self):
+        Path(self.file).parent.mkdir(exist_ok=True, parents=True)
+        with self.get_connection() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS games (
+                    id INTEGER PRIMARY KEY,
+                    date TEXT NOT NULL,
+                    game_mode TEXT NOT NULL,
+                    answer TEXT NOT NULL,
+                    solved INTEGER NOT NULL,
+                    guesses INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS games_date ON games (date);
+                CREATE INDEX IF NOT EXISTS games_game_mode ON games (game_mode, date);
+                CREATE INDEX IF NOT EXISTS games_answer ON games (answer);
+            """)
+
+    def save_stats_csv(self, date: str, game_mode: str, answer: str, solved: bool, guesses: int):
+        self.save_many([(date, game_mode, answer, solved, guesses)])
+
+    def save_many(self, rows: list[tuple[str, str, str, bool, int]]) -> int:
+        """
+        Insert many results in one transaction.
+
+        Parameters:
+        - rows: A list of (date, game_mode, answer, solved, guesses) tuples.
+
+        Returns:
+        - saved: The number of valid rows inserted.
+        """
+        valid_rows = [
+            (date, game_mode, answer, str(solved) == "True", int(guesses))
+            for date, game_mode, answer, solved, guesses in rows
+            if self.check_valid_stats(int(guesses), answer)
+        ]
+        with self.get_connection() as connection:
+            connection.executemany(
+                "INSERT INTO games (date, game_mode, answer, solved, guesses) VALUES (?, ?, ?, ?, ?)",
+                valid_rows
+            )
+        return len(valid_rows)
+
+    def get_answer(self, date: str = None) -> str:
+        # no date returns the most recent answer
+        if date:
+            query, params = "SELECT answer FROM games WHERE date = ? ORDER BY id LIMIT 1", (date,)
+        else:
+            query, params = "SELECT answer FROM games ORDER BY id DESC LIMIT 1", ()
+        row = self.get_connection().execute(query, params).fetchone()
+        return row[0] if row else None
+
+    def import_csv(self, csv_file: str) -> int:
+        """
+        Import the rows of a stats.csv file.
+
+        Parameters:
+        - csv_file: Path to the CSV stats file.
+
+        Returns:
+        - saved: The number of rows imported.
+        """
+        with open(csv_file, "r", newline="") as stats_file:
+            reader = csv.reader(stats_file, delimiter=";")
+            next(reader)
+            return self.save_many([row for row in reader if len(row) == 5])
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+class BufferedStatsWriter:
+    """
+    Collects game results and writes them to a stats backend in batches.
+
+    A batch is written once FLUSH_ROWS results are waiting or the oldest has waited FLUSH_SECONDS
+    (checked on every save and by a timer thread), and whatever is left when the context exits.
+    Same save_stats_csv/save_many calls as the backends.
+    """
+    def __init__(self, stats: WordleStats, max_rows: int = FLUSH_ROWS, max_seconds: float = FLUSH_SECONDS):
+        self.stats = stats
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self.rows = [] # format as [(date, game_mode, answer, solved, guesses)]
+        self.oldest = None # monotonic time the oldest buffered row was added
+        self.timer = None # flushes the buffer max_seconds after its oldest row when no save does first
+        self.lock = threading.RLock() # re-entrant, a signal handler may flush while the main thread holds it
+        self.saved = 0
+
+    def __enter__(self) -> "BufferedStatsWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def save_stats_csv(self, date: str, game_mode: str, answer: str, solved: bool, guesses: int) -> None:
+        self.save_many([(date, game_mode, answer, solved, guesses)])
+
+    def save_many(self, rows: list[tuple[str, str, str, bool, int]]) -> None:
+        with self.lock:
+            if not self.rows:
+                self.oldest = time.monotonic()
+                self.start_timer()
+            self.rows.extend(rows)
+            if len(self.rows) >= self.max_rows or time.monotonic() - self.oldest >= self.max_seconds:
+                self.flush()
+
+    def start_timer(self) -> None:
+        self.timer = threading.Timer(self.max_seconds, self.flush)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def flush(self) -> int:
+        """
+        Write every buffered result now.
+
+        Rows stay buffered until the backend has written them, so a failed or interrupted
+        write leaves them for the next flush.
+
+        Returns:
+        - saved: The number of valid rows written.
+        """
+        with self.lock, signals_deferred():
+            if self.timer is not None and self.timer is not threading.current_thread():
+                self.timer.cancel()
+            self.timer = None
+            if not self.rows:
+                self.oldest = None
+                return 0
+            rows = list(self.rows)
+            saved = self.stats.save_many(rows)
+            del self.rows[:len(rows)]
+            self.oldest = None
+            self.saved += saved
+            return saved
+
+    def get_file(self):
+        return self.stats.get_file()
+
+def open_stats(filename: str) -> WordleStats:
+    """
+    Open the stats backend matching the file name, SQLite for .db/.sqlite and CSV otherwise.
+    """
+    if filename.endswith(SQLITE_SUFFIXES):
+        return SQLiteStats(filename)
+    return WordleStats(filename)
+
 if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "import":
+        # python stats_manager.py import stats.csv stats.db
+        database = SQLiteStats(sys.argv[3])
+        imported = database.import_csv(f"../database/{sys.argv[2]}")
+        print(f"Imported {imported} games into {database.get_file()}")
+        sys.exit(0)
+
     today = datetime.today().strftime("%Y-%m-%d") # year-month-day
     stats = WordleStats("stats.csv")
     print(stats.create_headers()) 
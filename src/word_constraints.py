@@ -0,0 +1,136 @@
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+LETTER_BITS = len(ALPHABET)
+ALL_LETTERS = (1 << LETTER_BITS) - 1
+WORD_LENGTH = 5
+MAX_WORD_LENGTH = 8
+COUNT_BITS = MAX_WORD_LENGTH # thermometer slot per letter, wide enough for any supported word length
+
+
+def encode_word(word: str) -> tuple[int, int]:
+    """
+    Encode a word into the integer masks used by WordConstraints.
+
+    The position mask packs one 26 bit one-hot field per position. The count mask
+    stores each letter's count as a thermometer code (count c sets the first c bits
+    of that letter's COUNT_BITS slot) so min/max checks become a single AND.
+    Works for any word length up to MAX_WORD_LENGTH.
+
+    Parameters:
+    - word: The word to encode.
+
+    Returns:
+    - (position_mask, count_mask): The encoded word.
+    """
+    position_mask = 0
+    count_mask = 0
+    for position, letter in enumerate(word):
+        letter_index = ALPHABET.index(letter)
+        position_mask |= 1 << (position * LETTER_BITS + letter_index)
+
+    for letter in set(word):
+        count = word.count(letter)
+        count_mask |= ((1 << count) - 1) << (ALPHABET.index(letter) * COUNT_BITS)
+
+    return position_mask, count_mask
+
+
+class WordConstraints:
+    def __init__(self, word_length: int = WORD_LENGTH):
+        if not 1 <= word_length <= MAX_WORD_LENGTH:
+            raise ValueError(f"Word length must be between 1 and {MAX_WORD_LENGTH}, got {word_length}")
+        self.word_length = word_length
+        self.allowed = [ALL_LETTERS] * word_length # format as {position: 26 bit allowed letter mask}
+        self.min_counts = {} # format as {letter: minimum count}
+        self.max_counts = {} # format as {letter: maximum count}
+
+    def add_feedback(self, guess: str, letter_states: list[str]) -> None:
+        """
+        Tighten the constraints with one revealed row.
+
+        A letter's correct and present tiles in the row give its minimum count. If any of its tiles
+        is absent the count is also capped there, so an absent repeat no longer bans the letter everywhere.
+
+        Parameters:
+        - guess: The guessed word.
+        - letter_states: The data-state of each tile ("correct", "present" or "absent").
+
+        Returns:
+        None
+        """
+        found_counts = {} # format as {letter: correct + present tiles in this row}
+        capped_letters = set()
+        for position, (letter, state) in enumerate(zip(guess, letter_states)):
+            match state:
+                case "correct":
+                    self.fix_letter(letter, position)
+                    found_counts[letter] = found_counts.get(letter, 0) + 1
+                case "present":
+                    self.ban_letter(letter, position)
+                    found_counts[letter] = found_counts.get(letter, 0) + 1
+                case "absent":
+                    self.ban_letter(letter, position)
+                    capped_letters.add(letter)
+
+        for letter, count in found_counts.items():
+            self.require_letter(letter, count)
+        for letter in capped_letters:
+            self.limit_letter(letter, found_counts.get(letter, 0))
+
+    def ban_letter(self, letter: str, position: int) -> None:
+        self.allowed[position] &= ~(1 << ALPHABET.index(letter))
+
+    def fix_letter(self, letter: str, position: int) -> None:
+        self.allowed[position] = 1 << ALPHABET.index(letter)
+
+    def require_letter(self, letter: str, count: int) -> None:
+        self.min_counts[letter] = max(self.min_counts.get(letter, 0), count)
+
+    def limit_letter(self, letter: str, count: int) -> None:
+        self.max_counts[letter] = min(self.max_counts.get(letter, self.word_length), count)
+
+    def compile(self) -> tuple[int, int, int]:
+        """
+        Compile the constraints into the masks checked against each encoded word.
+
+        Returns:
+        - (banned_positions, required_counts, banned_counts): Masks for filter().
+        """
+        banned_positions = 0
+        for position, allowed_letters in enumerate(self.allowed):
+            banned_positions |= (ALL_LETTERS & ~allowed_letters) << (position * LETTER_BITS)
+
+        required_counts = 0
+        for letter, count in self.min_counts.items():
+            if count > 0:
+                required_counts |= 1 << (ALPHABET.index(letter) * COUNT_BITS + count - 1)
+
+        banned_counts = 0
+        for letter, count in self.max_counts.items():
+            if count < self.word_length:
+                banned_counts |= 1 << (ALPHABET.index(letter) * COUNT_BITS + count)
+
+        return banned_positions, required_counts, banned_counts
+
+    def filter(self, word_list: list[str], word_codes: dict) -> list[str]:
+        """
+        Keep the words that satisfy every constraint.
+
+        Parameters:
+        - word_list: The list of words.
+        - word_codes: A dictionary of encoded words from encode_word.
+
+        Returns:
+        - filtered_word_list: The filtered list of words.
+        """
+        banned_positions, required_counts, banned_counts = self.compile()
+
+        filtered_word_list = []
+        for word in word_list:
+            position_mask, count_mask = word_codes[word]
+            if position_mask & banned_positions or count_mask & banned_counts:
+                continue
+            if count_mask & required_counts != required_counts:
+                continue
+            filtered_word_list.append(word)
+
+        return filtered_word_list
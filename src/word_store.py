@@ -0,0 +1,192 @@
+import ast # To eval python literals, does not execute code
+from bisect import bisect_left
+import os
+import struct
+
+MAGIC = b"WRDL"
+VERSION = 1
+# magic, version, word length, word count, source size, source mtime (ns)
+HEADER = struct.Struct("<4sHHIQQ")
+
+DEFAULT_WORD_LENGTH = 5
+PREFIX_END = "{" # sorts right after "z", so prefix + PREFIX_END bounds every word starting with prefix
+
+loaded_stores: dict = {} # format as {source path: WordStore}, shared by every solver in the process
+
+
+class WordStore:
+    """
+    Word list compiled into a fixed width buffer: a header followed by word_length bytes per word.
+    The words are decoded once when loaded, the buffer itself is not kept.
+    """
+    def __init__(self, buffer: bytes, word_length: int, word_count: int):
+        self.word_length = word_length
+        self.word_count = word_count
+        packed_words = buffer[HEADER.size:HEADER.size + word_length * word_count].decode("ascii")
+        self.words: tuple[str, ...] = tuple(
+            packed_words[start:start + word_length] for start in range(0, len(packed_words), word_length)
+        )
+
+    def __len__(self) -> int:
+        return self.word_count
+
+
+class WordIndex:
+    """
+    Lookup structures over a word list: a hash of word to position for O(1) validation,
+    and a sorted copy for prefix queries with bisect.
+    """
+    def __init__(self, words: tuple[str, ...]):
+        self.words = tuple(words)
+        self.positions = {word: index for index, word in enumerate(self.words)} # format as {word: index}
+        self.sorted_words = tuple(sorted(self.words))
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.positions
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def get(self, word: str, default: int = None) -> int | None:
+        return self.positions.get(word, default)
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        """
+        Get every word starting with prefix, in alphabetical order.
+        """
+        start = bisect_left(self.sorted_words, prefix)
+        stop = bisect_left(self.sorted_words, prefix + PREFIX_END, start)
+        return list(self.sorted_words[start:stop])
+
+
+def read_source_words(source: str) -> list[str]:
+    try:
+        with open(source, "r") as word_txt:
+            return ast.literal_eval(word_txt.read())
+    except:
+        raise FileNotFoundError("Word list not found!")
+
+
+def compile_word_list(source: str, target: str) -> None:
+    """
+    Compile a words.txt python literal into the binary word store format.
+
+    Parameters:
+    - source: Path to the words.txt file.
+    - target: Path of the compiled file to write.
+
+    Returns:
+    None
+    """
+    word_list = read_source_words(source)
+    word_length = len(word_list[0])
+    source_stat = os.stat(source)
+
+    header = HEADER.pack(MAGIC, VERSION, word_length, len(word_list), source_stat.st_size, source_stat.st_mtime_ns)
+    temp_file = f"{target}.{os.getpid()}.tmp"
+    with open(temp_file, "wb") as store_file:
+        store_file.write(header)
+        store_file.write("".join(word_list).encode("ascii"))
+    os.replace(temp_file, target) # atomic so concurrent loaders never see a partial file
+
+
+def is_compiled_current(source: str, target: str) -> bool:
+    if not os.path.exists(target):
+        return False
+    with open(target, "rb") as store_file:
+        header = store_file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return False
+
+    magic, version, _, _, source_size, source_mtime = HEADER.unpack(header)
+    source_stat = os.stat(source)
+    return (magic, version, source_size, source_mtime) == (MAGIC, VERSION, source_stat.st_size, source_stat.st_mtime_ns)
+
+
+def load_word_store(source: str = "../data/words.txt") -> WordStore:
+    """
+    Load the compiled word list, compiling it first when missing or older than the source.
+
+    The compiled file is read in one go and cached per process, so every solver shares one copy.
+
+    Parameters:
+    - source: Path to the words.txt file.
+
+    Returns:
+    - store: The loaded word store.
+    """
+    if source in loaded_stores:
+        return loaded_stores[source]
+
+    if not os.path.exists(source):
+        raise FileNotFoundError("Word list not found!")
+
+    target = os.path.splitext(source)[0] + ".bin"
+    try:
+        if not is_compiled_current(source, target):
+            compile_word_list(source, target)
+        with open(target, "rb") as store_file:
+            buffer = store_file.read()
+    except OSError: # read only data dir, keep the compiled buffer in memory instead
+        word_list = read_source_words(source)
+        buffer = HEADER.pack(MAGIC, VERSION, len(word_list[0]), len(word_list), 0, 0) + "".join(word_list).encode("ascii")
+
+    _, _, word_length, word_count, _, _ = HEADER.unpack(buffer[:HEADER.size])
+    loaded_stores[source] = WordStore(buffer, word_length, word_count)
+    return loaded_stores[source]
+
+
+def load_answer_store(source: str = "../data/answers.txt") -> WordStore | None:
+    """
+    Load the optional list of possible answers, None if there is no answers file.
+    """
+    if not os.path.exists(source):
+        return None
+    return load_word_store(source)
+
+
+def word_list_sources(word_length: int = DEFAULT_WORD_LENGTH, data_dir: str = "../data/") -> tuple[str, str]:
+    """
+    Word list files for a word length: data/words.txt and data/answers.txt for 5 letters,
+    data/words_<length>.txt and data/answers_<length>.txt for variants.
+    """
+    suffix = "" if word_length == DEFAULT_WORD_LENGTH else f"_{word_length}"
+    return os.path.join(data_dir, f"words{suffix}.txt"), os.path.join(data_dir, f"answers{suffix}.txt")
+
+
+def load_word_lists(word_list: list[str] = None, answer_list: list[str] = None, word_length: int = None) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Resolve the allowed guesses and possible answers a solver plays with.
+
+    With no word list the guesses come from data/words.txt and the answers from data/answers.txt
+    (see word_list_sources for other lengths), the answers are every allowed guess when a list has no separate answers.
+
+    Parameters:
+    - word_list: The allowed guesses, the word store if not given.
+    - answer_list: The possible answers, data/answers.txt or the allowed guesses if not given.
+    - word_length: Letters per word, taken from the word list if not given.
+
+    Returns:
+    - (guesses, answers): The allowed guesses, always including every answer, and the possible answers.
+    """
+    if not word_list:
+        words_source, answers_source = word_list_sources(word_length or DEFAULT_WORD_LENGTH)
+        word_list = load_word_store(words_source).words
+        if not answer_list:
+            answer_store = load_answer_store(answers_source)
+            answer_list = answer_store.words if answer_store else None
+
+    guesses = tuple(word_list)
+    answers = tuple(answer_list) if answer_list else guesses
+
+    word_length = word_length or len(guesses[0])
+    wrong_length = [word for word in set(guesses + answers) if len(word) != word_length]
+    if wrong_length:
+        raise ValueError(f"Expected {word_length} letter words, got {sorted(wrong_length)[:5]}")
+
+    if answers is guesses:
+        return guesses, guesses
+
+    guess_set = set(guesses)
+    missing_answers = tuple(answer for answer in answers if answer not in guess_set)
+    return guesses + missing_answers, answers
@@ -1,54 +1,81 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import ast # To eval python literals, does not execute code
 import os
-import logging
 import argparse
-import time
-from random import randint 
+from random import choice 
 from datetime import datetime 
 import signal
-from stats_manager import WordleStats
+from stats_manager import BufferedStatsWriter, WordleStats, open_stats
+from word_constraints import MAX_WORD_LENGTH, WordConstraints, encode_word
+from pattern_matrix import PatternMatrix, encode_words, pattern_from_states
+from scoring_strategies import STRATEGIES
+from feedback_oracle import FeedbackOracle
+from word_store import WordIndex, load_word_lists
+from opening_book import book_name, history_key, load_book
+from latency_tracker import LatencyTracker, timed_phase
+from game_trace import NOT_FILTERED, append_traces, trace_file, trace_rows
+from candidate_cache import CandidateCache, CandidateEntry
+import numpy as np
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING: # the browser backend is only imported once a browser game starts
+    from browser_backend import BrowserGame
+    from driver_pool import WebDriverPool
+
+MIN_WORD_LENGTH = 4 # variants run from MIN_WORD_LENGTH to MAX_WORD_LENGTH letters
+OFFLINE_STATS_FILE = "offline_stats.csv" # offline games are kept apart from the real daily games in stats.csv
+
 
 class WordleSolver:
-    def __init__(self):
-        self.incorrect_letters = {0: [], 1: [], 2: [], 3: [], 4: []}# format as {position: letter}
-        self.correct_letters = {0: [], 1: [], 2: [], 3: [], 4: []}# format as {position: letter}
-        self.wrong_position_letters = {0: [], 1: [], 2: [], 3: [], 4: []}# format as {position: letter}
+    def __init__(self, use_patterns: bool = False, strategy: str = "frequency", verbose: bool = True, word_list: list[str] = None, use_book: bool = False, track_latency: bool = False, answer_list: list[str] = None, word_length: int = None, max_attempts: int = 6, candidate_cache: CandidateCache = None, candidates_only: bool = False):
+        self.all_words, self.answers = load_word_lists(word_list, answer_list, word_length) # allowed guesses and possible answers, shared, never mutated
+        self.word_length = len(self.all_words[0]) # 5 for Wordle, 4-8 for variants
+        if not MIN_WORD_LENGTH <= self.word_length <= MAX_WORD_LENGTH:
+            raise ValueError(f"Word length must be between {MIN_WORD_LENGTH} and {MAX_WORD_LENGTH}, got {self.word_length}")
+        self.incorrect_letters = self.empty_letter_status() # format as {position: letter}
+        self.correct_letters = self.empty_letter_status() # format as {position: letter}
+        self.wrong_position_letters = self.empty_letter_status() # format as {position: letter}
+        self.constraints = WordConstraints(self.word_length) # per position allowed letters and min/max letter counts from every row
         self.letter_state_action = {
             'correct': self.action_correct,
             'absent': self.action_absent,
             'present': self.action_present
         }
-        self.word_list: list = self.get_words_list()
+        self.has_answer_list = self.answers != self.all_words # answers are a smaller list than the allowed guesses
+        self.word_list: list = list(self.answers) # remaining candidates, only ever answers
+        self.word_codes: dict = {word: encode_word(word) for word in self.answers} # encoded once, reused by every filter
+        self.answer_codes = encode_words(self.answers) # (answers, word length) uint8, encoded once for the scoring strategies
+        self.answer_codes.setflags(write=False)
+        self.guess_index = WordIndex(self.all_words) # O(1) guess validation and prefix lookups
+        self.answer_index = WordIndex(self.answers) if self.has_answer_list else self.guess_index
         self.attempts = 0
-        self.__max_attempts = 6
+        self.__max_attempts = max_attempts
         self.game_mode = ""
         self.__answer = ""
         self.__solved: bool = ""
         self.wordle = None
-
-    def get_words_list(self) -> list[str]:
-        """
-        Get the list of words from a file.
-
-        Returns:
-        - word_list: The list of words.
-        """
-        try:
-            with open('../data/words.txt', 'r') as word_txt:
-
-                word_txt = word_txt.read()
-                word_list = ast.literal_eval(word_txt)
-                
-        except:
-            raise FileNotFoundError("Word list not found!")
-
-        return word_list
+        self.driver_pool = None
+        self.opening_guess = None # fixed first guess for auto games, solved for when None
+        self.verbose = verbose
+        self.verify_guesses = False # check each browser guess was accepted instead of waiting for a timeout
+        self.guess_history = [] # format as [(guess, pattern)]
+        self.candidate_counts = [] # candidates left before each guess in guess_history
+        self.candidate_count = len(self.word_list) # candidates left for the next guess
+        self.latency = LatencyTracker() if track_latency else None # per phase timings, off by default
+        self.strategy = STRATEGIES[strategy]()
+        self.candidates_only = candidates_only and self.strategy.requires_patterns
+        if self.candidates_only:
+            self.strategy.probe_guesses = False # faster, but a word that can't be the answer often splits the candidates better
+        use_patterns = use_patterns or self.strategy.requires_patterns
+        self.patterns = PatternMatrix(self.all_words, answer_list=self.answers if self.has_answer_list else None) if use_patterns else None # guess x answer feedback lookup
+        self.book = load_book(book_name(strategy, use_patterns, self.candidates_only), self.all_words, self.answers) if use_book else None # format as {history key: guess}
+        self.candidate_cache = candidate_cache if candidate_cache is not None else CandidateCache() # history key -> candidates and guess, kept across games
+
+    @property
+    def max_attempts(self) -> int:
+        return self.__max_attempts
+
+    def empty_letter_status(self) -> dict[int, list]:
+        return {position: [] for position in range(self.word_length)}
 
     # Actions for letter status [incorrect, correct, present]
     def action_correct(self, letter: str, position: int) -> None:
@@ -93,31 +120,7 @@ class WordleSolver:
         if letter not in self.wrong_position_letters.get(position, []):
             self.wrong_position_letters.setdefault(position, []).append(letter)
 
-    def get_index_correct_letters(self) -> list:
-        """
-        Get the index and letter of correct letters.
-
-        Parameters:
-        - correct_letters: A dictionary of correct letters.
-
-        Returns:
-        - sequences: A list of sequences of correct letters.
-        """
-        sequences = []
-        current_sequence = []
-
-        for index in range(len(self.correct_letters)):
-            if self.correct_letters[index]:
-                current_sequence.append((index, self.correct_letters[index][0]))
-            elif current_sequence:
-                sequences.append(current_sequence)
-                current_sequence = []
-        
-        if current_sequence:
-            sequences.append(current_sequence)
-        
-        return sequences
-
+    @timed_phase("solve")
     def solve_next_word(self) -> str:
         """
         Solve the next word based on the current word list and incorrect letters.
@@ -129,158 +132,102 @@ class WordleSolver:
         Returns:
         - possible_guess: Next best guess
         """
-
-        self.word_list = self.eliminate_incorrect_letters() # Eliminates incorrect letter positions
-        self.word_list = self.eliminate_wo_correct_letters() # Eliminates words without correct letters
-        self.word_list = self.eliminate_wrong_pos_letters()
+        if self.book:
+            book_guess = self.book.get(history_key(self.guess_history))
+            if book_guess: # the word list is left as is, later filters still apply every constraint
+                self.candidate_count = NOT_FILTERED
+                self.announce("Next possible guess:", book_guess)
+                return book_guess
+
+        # games sharing a history prefix (the same opening, say) skip straight to the step where they diverge
+        key = history_key(self.guess_history)
+        cached = self.candidate_cache.get(key)
+        if cached is not None and cached.guess is not None:
+            self.word_list = [self.answers[index] for index in cached.candidates]
+            self.candidate_count = len(self.word_list)
+            self.announce("Next possible guess:", cached.guess)
+            return cached.guess
+
+        if self.patterns:
+            self.word_list = self.eliminate_by_patterns()
+        else:
+            self.word_list = self.eliminate_by_constraints()
+        self.candidate_count = len(self.word_list)
             
-        possible_guess = self.letter_frequency_rating()[1]
-        print("Next possible guess:", possible_guess)
+        candidates = self.get_candidate_indices()
+        possible_guess = self.rate_words(candidates)[1]
+        self.candidate_cache.put(key, CandidateEntry(candidates, possible_guess))
+        self.announce("Next possible guess:", possible_guess)
         return possible_guess
-        
 
-
-    def eliminate_incorrect_letters(self) -> list:
+    def get_candidate_indices(self) -> np.ndarray:
         """
-        Eliminate words that overlap with the incorrect letters.
-
-        Parameters:
-        - word_list: The list of words.
+        Get the remaining candidates as indices into the answer list.
 
         Returns:
-        - filtered_word_list: The filtered list of words.
+        - candidates: An int32 array, the form they are cached in.
         """
-        return [word for word in self.word_list if not any(word[position] in self.incorrect_letters[position] for position in range(len(word)))]
+        return np.fromiter((self.answer_index.get(word) for word in self.word_list), dtype=np.int32, count=len(self.word_list))
 
-    def eliminate_wo_correct_letters(self) -> list:
+    @timed_phase("eliminate")
+    def eliminate_by_constraints(self) -> list:
         """
-        Eliminate words without the correct letters.
+        Eliminate words that break the known letter constraints.
 
-        Parameters:
-        - word_list: The list of words.
+        Checks the per position allowed letters and the min/max letter counts, compiled
+        into bitmasks, against the pre-encoded word list.
 
         Returns:
         - filtered_word_list: The filtered list of words.
         """
-        filtered_word_list = []
-        for word in self.word_list:
-            all_sequence_match = True
-            for seq in self.get_index_correct_letters():
-                start_index = seq[0][0]
-                end_index = len(seq) + start_index
-                seq_letters = ''.join([letter for _, letter in seq]) # every seq is in the (index, letter) format. using _, bc index isn't used in this operation 
-                if word[start_index:end_index] != seq_letters:
-                    all_sequence_match = False
-                    break
-            
-            if all_sequence_match:
-                filtered_word_list.append(word)
+        return self.constraints.filter(self.word_list, self.word_codes)
 
-        return filtered_word_list
-
-    def eliminate_wrong_pos_letters(self) -> list:
+    @timed_phase("eliminate")
+    def eliminate_by_patterns(self) -> list:
         """
-        Eliminate words that overlap with the correct letters but in the wrong position.
+        Eliminate words that would not have produced the feedback seen so far.
 
-        Parameters:
-        - word_list: The list of words.
+        Uses the precomputed pattern matrix, one vectorized comparison per guess.
 
         Returns:
         - filtered_word_list: The filtered list of words.
         """
-        filtered_word_list = []
-        
-        for word in self.word_list:
-            valid_word = True
-            for position, wrong_pos_letters in self.wrong_position_letters.items():
-                if word[position] in wrong_pos_letters:
-                    valid_word = False
-                    break
-                
-                #if word[position] not in sum(wrong_position_letters.values(), []): # sum is used to concatenate all the lists into one list []
-                required_letters = sum(self.wrong_position_letters.values(), [])
-                if not all(letter in word for letter in required_letters):
-                    valid_word = False
-                    break
-            
-            if valid_word:
-                filtered_word_list.append(word)
-        
-        return filtered_word_list
+        candidates = np.arange(len(self.patterns.answer_list))
+        for guess, pattern in self.guess_history:
+            candidates = self.patterns.filter(candidates, guess, pattern)
+
+        return [self.patterns.answer_list[index] for index in candidates]
 
-    def letter_frequency_rating(self) -> tuple[int, str]:
+    @timed_phase("rate")
+    def rate_words(self, candidates: np.ndarray) -> tuple[float, str]:
         """
-        Calculate the letter frequency rating for each word in the word list.
+        Rate the remaining words with the selected scoring strategy.
 
         Parameters:
-        - word_list: The list of words.
-        - incorrect_letters: A dictionary of incorrect letters.
+        - candidates: The remaining words as indices into the answer list.
 
         Returns:
         - highest_word_score: A tuple containing the highest word score and the corresponding word.
         """
-        letter_frequency = {
-            'E' : 12.0,
-            'T' : 9.10,
-            'A' : 8.12,
-            'O' : 7.68,
-            'I' : 7.31,
-            'N' : 6.95,
-            'S' : 6.28,
-            'R' : 6.02,
-            'H' : 5.92,
-            'D' : 4.32,
-            'L' : 3.98,
-            'U' : 2.88,
-            'C' : 2.71,
-            'M' : 2.61,
-            'F' : 2.30,
-            'Y' : 2.11,
-            'W' : 2.09,
-            'G' : 2.03,
-            'P' : 1.82,
-            'B' : 1.49,
-            'V' : 1.11,
-            'K' : 0.69,
-            'X' : 0.17,
-            'Q' : 0.11,
-            'J' : 0.10,
-            'Z' : 0.07 
-            }
-
-        highest_word_score = (0,)
-        for word in self.word_list:
-            word_score = 0
-
-            for letter in set(word): # using set to prevent duplicate letters
-                if letter not in sum(self.incorrect_letters.values(), []): # sum used with [] to concatenate all the incorrect letters into a list
-                    word_score += letter_frequency.get(letter.upper(), 0) # must convert lower to upper
-            
-            if highest_word_score[0] == 0 or word_score > highest_word_score[0]:
-                highest_word_score = (word_score, word)
-
-        return highest_word_score
+        return self.strategy.rate_candidates(candidates, self.answers, self.answer_codes, self.patterns)
   
-    def show_correct_answer(self, wordle: webdriver) -> str:
+    def show_correct_answer(self, wordle: "BrowserGame | FeedbackOracle") -> str:
         """
         Returns the correct answer in the Wordle game.
 
         Parameters:
-        - wordle: The webdriver instance for the Wordle game.
+        - wordle: The browser game or offline oracle for the Wordle game.
 
         Returns:
         - correct_word: The correct word.
         """
-        wait = WebDriverWait(wordle, 10)
-
         if self.is_wordle_solved():
             correct_word = "".join((sum(self.correct_letters.values(), [])))
             self.__answer = correct_word
             return self.__answer
-        
+
         try:
-            correct_word_element = wait.until(EC.presence_of_element_located((By.XPATH, '//div[@class="Toast-module_toast__iiVsN"]')))
-            correct_word = correct_word_element.text
+            correct_word = wordle.read_answer()
         except:
             raise Exception(
                 f"Failed to use all guesses.\nCorrect word list: {self.correct_letters}"
@@ -290,66 +237,57 @@ class WordleSolver:
 
         return self.__answer        
         
-    def update_letter_status(self, wordle: webdriver) -> None:
+    @timed_phase("read")
+    def update_letter_status(self, wordle: "BrowserGame | FeedbackOracle") -> None:
         """
         Get the letter status for a given row in the Wordle game then updates letter status dictionary.
 
         Parameters:
-        - wordle: The webdriver instance for the Wordle game.
-        - row: The row number.
+        - wordle: The browser game or offline oracle for the Wordle game.
 
         Returns:
         None
         """
-        wait = WebDriverWait(wordle, 3)  
-        row_selector =  f'//div[@aria-label="Row {self.attempts + 1}"]' # +1 compensates for 0 based indexing to 1 based for Wordle rows
+        self.apply_letter_status(wordle.get_row(self.attempts))
 
-        row = wait.until(EC.presence_of_all_elements_located((By.XPATH, row_selector)))
-        
+    def apply_letter_status(self, tiles: list[tuple[str, str]]) -> None:
+        """
+        Update the letter status dictionaries from a revealed row.
 
-        # Finds the updated data-state (when it changes from tbd)
-        while True:
-            letter_status_selector = f'{row_selector}//div[@data-state]'
-            letter_status = wait.until(EC.presence_of_all_elements_located((By.XPATH, letter_status_selector)))
+        Parameters:
+        - tiles: A list of (letter, data-state) tuples.
 
-            if letter_status[4].get_attribute('data-state') != 'tbd':
-                break
-        
-        for position, tile in enumerate(letter_status):
-            letter_data_state = tile.get_attribute('data-state')
-            letter = tile.text
+        Returns:
+        None
+        """
+        guess = ""
+        letter_states = []
+        for position, (letter, letter_data_state) in enumerate(tiles):
+            guess += letter
+            letter_states.append(letter_data_state)
             if letter_data_state in self.letter_state_action:
-                # if letter.lower() in self.correct_letters[position]:
-                #     print('Duplicate correct: ', letter)
-                
-                # elif letter.lower() in self.incorrect_letters[position]:
-                #     print('Duplicate incorrect: ', letter)
+                if letter not in self.correct_letters[position] + self.incorrect_letters[position]:
+                    self.letter_state_action[letter_data_state](letter, position)
 
-                # else:
-                #     self.letter_state_action[letter_data_state](letter.lower(), position)
-                if letter.lower() not in [self.correct_letters[position], self.incorrect_letters[position]]:
-                    self.letter_state_action[letter_data_state](letter.lower(), position)
+        self.constraints.add_feedback(guess, letter_states)
+        self.guess_history.append((guess, pattern_from_states(letter_states)))
+        self.candidate_counts.append(self.candidate_count)
+        self.candidate_count = NOT_FILTERED # unknown until the next solve
                 
-    def submit_guess(self, wordle: webdriver, letters: str) -> None:       
+    @timed_phase("submit")
+    def submit_guess(self, wordle: "BrowserGame | FeedbackOracle", letters: str) -> None:       
         """
         Submit a guess in the Wordle game.
 
         Parameters:
-        - wordle: The webdriver instance for the Wordle game.
+        - wordle: The browser game or offline oracle for the Wordle game.
         - letters: The letters to guess.
 
         Returns:
         None
         """
-        wait = WebDriverWait(wordle, 10)
-        letter_button = wait.until(EC.presence_of_element_located((By.XPATH, f'//button[@data-key="z"]')))
-
-        for letter in list(letters):
-            wordle.find_element(By.XPATH, f'//button[@data-key="{letter}"]').click()
-        
-        if True:
-            print(f"Submitted guess: {letters}")
-        wordle.find_element(By.XPATH, f'//button[@data-key="↵"]').click()
+        wordle.submit_guess(letters, self.attempts)
+        self.announce(f"Submitted guess: {letters}")
             
     def user_guess(self):
         """
@@ -359,7 +297,7 @@ class WordleSolver:
         - guess: The user's guess.
         """
         while True:
-            guess = input('Enter your guess (5 letters): ')
+            guess = input(f'Enter your guess ({self.word_length} letters): ')
             if self.valid_word(guess):
                 return guess 
 
@@ -373,9 +311,10 @@ class WordleSolver:
         Returns:
         - valid: True if the word is valid, False otherwise.
         """        
-        print('Word valid!') if guess in self.word_list else print('Invalid!')
+        is_valid = guess in self.guess_index # hashed lookup, any allowed guess not just the remaining candidates
+        print('Word valid!') if is_valid else print('Invalid!')
         
-        return guess in self.word_list
+        return is_valid
 
     def is_wordle_solved(self) -> bool:
         """
@@ -387,58 +326,32 @@ class WordleSolver:
         Returns:
             bool: True if the puzzle is solved, False otherwise.
         """
-        if len(sum(self.correct_letters.values(), [])) == 5:
+        if len(sum(self.correct_letters.values(), [])) == self.word_length:
             self.__solved = True
             return True
         self.__solved = False
         return False
         
-    def startGame(self, mode: str = "auto", browser: bool = False) -> None:
+    def startGame(self, mode: str = "auto", browser: bool = False, driver_pool: "WebDriverPool" = None) -> None:
         """
         Start the Wordle game.
 
+        Parameters:
+        - mode: The game mode.
+        - browser: Show the browser window instead of running headless.
+        - driver_pool: Reuse a warm session from this pool instead of launching Chrome.
+
         Returns:
         True if game solved, else False
         """
-        # Set the logging level to supress error messages
         self.resetGame()     # Resets to play same instance again
         self.game_mode = mode    
-
-        logging.getLogger('selenium').setLevel(logging.CRITICAL)
-
-        # Set the logging level to only show fatal messages
-        chrome_options = Options()
-        if not browser:
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("window-size=1900,1080") # required for linux
-
-
-        chrome_options.add_argument('--log-level=3')
-        chrome_options.add_argument("--incognito")
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--no-sandbox")
+        self.driver_pool = driver_pool
 
         try:
-            self.wordle = webdriver.Chrome(options=chrome_options)
-            self.wordle.get('https://www.nytimes.com/games/wordle/index.html')
-
-            wait = WebDriverWait(self.wordle, 5)
-            
-            play_button = wait.until(EC.presence_of_element_located((By.XPATH, '//button[@type="button" and text()="Play"]')))
-            play_button.click()
-
-            x_button = wait.until(EC.presence_of_element_located((By.XPATH, '//button[@type="button" and @aria-label="Close"]')))
-            x_button.click()
+            self.start_driver(browser)
  
-            match self.game_mode:
-                case "manual":
-                    self.manual_play(self.wordle)
-                case "rand": 
-                    self.random_auto_play(self.wordle)
-                case "auto":
-                    self.auto_play(self.wordle)
-
-            answer = self.show_correct_answer(self.wordle)
+            self.play_game(self.wordle)
             self.print_game_result_box()
             
         except Exception as err:
@@ -447,10 +360,77 @@ class WordleSolver:
         finally:
             self.close_webdriver()
 
+    @timed_phase("driver_start")
+    def start_driver(self, browser: bool = False) -> None:
+        from browser_backend import BrowserGame, create_driver, open_wordle
+        if self.driver_pool:
+            self.wordle = BrowserGame(self.driver_pool.acquire(), self.driver_pool, self.verify_guesses)
+        else:
+            self.wordle = BrowserGame(create_driver(browser), verify=self.verify_guesses)
+            open_wordle(self.wordle.driver)
+
+    def startOfflineGame(self, mode: str = "auto", answer: str = None) -> bool:
+        """
+        Play a game against the in-process FeedbackOracle instead of the Wordle website.
+
+        Parameters:
+        - mode: The game mode.
+        - answer: The answer to play against, a random word from the list if not given.
+
+        Returns:
+        True if game solved, else False
+        """
+        answer = self.check_answer(answer) if answer else choice(self.answers)
+        self.resetGame()
+        self.game_mode = mode
+        self.wordle = FeedbackOracle(answer)
+
+        self.play_game(self.wordle)
+        if self.verbose:
+            self.print_game_result_box()
+
+        self.wordle = None
+        return self.__solved
+
+    def check_answer(self, answer: str) -> str:
+        """
+        Check an answer for an offline game can be solved for.
+
+        Parameters:
+        - answer: The answer, any case.
+
+        Returns:
+        - answer: The lowercase answer, raises ValueError if it isn't in the answer list.
+        """
+        answer = answer.strip().lower()
+        if len(answer) != self.word_length:
+            raise ValueError(f"Answer {answer!r} is not {self.word_length} letters long")
+        if answer not in self.answer_index:
+            raise ValueError(f"Answer {answer!r} is not in the answer list")
+        return answer
+
+    def play_game(self, wordle: "BrowserGame | FeedbackOracle") -> str:
+        """
+        Play the selected game mode to the end and return the answer.
+        """
+        match self.game_mode:
+            case "manual":
+                self.manual_play(wordle)
+            case "rand": 
+                self.random_auto_play(wordle)
+            case "auto":
+                self.auto_play(wordle)
+
+        return self.show_correct_answer(wordle)
+
+    def announce(self, *message) -> None:
+        if self.verbose:
+            print(*message)
+
     def close_webdriver(self) -> None:
-        if not self.wordle and self.wordle.service.is_connectable():
-            self.wordle.quit()
-            self.wordle = None
+        if self.wordle:
+            self.wordle.quit() # a pooled browser session is released to stay warm, any other is closed
+        self.wordle = None
 
     def print_game_result_box(self) -> None:
         print()
@@ -480,65 +460,67 @@ class WordleSolver:
         print(box_border * box_length)
 
 
-    def manual_play(self, wordle: webdriver) -> None:
+    def manual_play(self, wordle: "BrowserGame | FeedbackOracle") -> None:
         while self.attempts < self.__max_attempts:
-            if self.attempts != 6:
-                print('This is attempt', self.attempts + 1)
+            if self.attempts != self.__max_attempts:
+                self.announce('This is attempt', self.attempts + 1)
             guess = self.user_guess()
             self.submit_guess(wordle, guess)
             self.update_letter_status(wordle)
             self.attempts += 1
             if self.is_wordle_solved():
-                print('Wordle solved!')
+                self.announce('Wordle solved!')
                 break
             self.solve_next_word()
-            print()
+            self.announce()
             
     
-    def auto_play(self, wordle: webdriver) -> None:    
-        for guesses in range(self.__max_attempts): # wordle row starts from 1, not 0 based indexing (6 guesses total)
+    def auto_play(self, wordle: "BrowserGame | FeedbackOracle") -> None:    
+        for guesses in range(self.__max_attempts): # wordle row starts from 1, not 0 based indexing (6 guesses total in Wordle)
             if self.is_wordle_solved(): 
                 self.attempts = guesses
                 break
 
-            print("-------")
-            print(f"This is attempt {self.attempts + 1}")
+            self.announce("-------")
+            self.announce(f"This is attempt {self.attempts + 1}")
 
-            guess = self.solve_next_word()
-            time.sleep(1)
+            guess = self.opening_guess if self.attempts == 0 and self.opening_guess else self.solve_next_word()
             self.submit_guess(wordle, guess)
-            time.sleep(1)
             self.update_letter_status(wordle)
             self.attempts += 1
 
         
 
-    def random_auto_play(self, wordle: webdriver) -> None:
+    def random_auto_play(self, wordle: "BrowserGame | FeedbackOracle") -> None:
         for guesses in range(self.__max_attempts): # wordle row starts from 1, not 0 based indexing
             if self.is_wordle_solved():
                 break
             
-            print("-------")
-            print("This is attempt", self.attempts + 1)
+            self.announce("-------")
+            self.announce("This is attempt", self.attempts + 1)
             
-            guess = self.solve_next_word() if guesses != 0 else self.word_list[randint(0, len(self.word_list))]
-            time.sleep(1)
+            guess = self.solve_next_word() if guesses != 0 else choice(self.word_list)
             self.submit_guess(wordle, guess)
-            time.sleep(1)
             self.update_letter_status(wordle)
             self.attempts += 1
 
 
 
     def resetGame(self) -> None:
-        self.word_list = self.get_words_list()
+        self.word_list = list(self.answers) # cheap copy, the word lists are only parsed once per process
         self.attempts = 0
         self.__answer = ""
         self.__solved = ""
-        self.incorrect_letters = {0: [], 1: [], 2: [], 3: [], 4: []}# format as {position: letter}
-        self.correct_letters = {0: [], 1: [], 2: [], 3: [], 4: []}# format as {position: letter}
-        self.wrong_position_letters = {0: [], 1: [], 2: [], 3: [], 4: []}# format as {position: letter}
+        self.incorrect_letters = self.empty_letter_status() # format as {position: letter}
+        self.correct_letters = self.empty_letter_status() # format as {position: letter}
+        self.wrong_position_letters = self.empty_letter_status() # format as {position: letter}
+        self.constraints = WordConstraints(self.word_length)
+        self.guess_history = []
+        self.candidate_counts = []
+        self.candidate_count = len(self.word_list)
         self.wordle = None
+        if self.latency:
+            self.latency.reset()
                 
     def print_win_rate(self, yes: int, no: int):
         total_games_played = yes + no
@@ -556,6 +538,15 @@ class WordleSolver:
         guesses = self.attempts
 
         return [date, game_mode, answer, solved, guesses]
+
+    def get_trace(self) -> np.ndarray:
+        """
+        Get the game's guesses, feedback patterns and candidates left before each guess as packed trace rows.
+
+        Returns:
+        - rows: A game_trace.TRACE_DTYPE array, one row per guess.
+        """
+        return trace_rows(self.guess_history, self.candidate_counts, self.__answer, self.guess_index)
     
     def __str__(self):
         raise NotImplementedError("__str__ is not coded.")
@@ -578,31 +569,133 @@ def parse_cmd_arguments() -> argparse:
         help="solver opens a selenium browser window for you to watch as it solves",
         action="store_true"
     )
+    parser.add_argument(
+        "--offline", 
+        help="play against a local answer instead of the Wordle website (no browser or network)",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--answer", 
+        help="answer for --offline games, a random word if not given"
+    )
+    parser.add_argument(
+        "--strategy", 
+        help="select how the next guess is scored (entropy, expected and minimax use the pattern matrix)",
+        choices=list(STRATEGIES), 
+        default="frequency"
+    )
+    parser.add_argument(
+        "--book", 
+        help="look guesses up in the precomputed decision tree (built with opening_book.py) before solving",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--games", 
+        help="number of games to play back to back, browser games reuse one warm Chrome session",
+        type=int,
+        default=1
+    )
+    parser.add_argument(
+        "--verify", 
+        help="check that the page accepted each guess and fail fast on rejected words",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--stats", 
+        help=f"stats file in database/, a .db or .sqlite name uses the SQLite backend (default stats.csv, {OFFLINE_STATS_FILE} for --offline)"
+    )
+    parser.add_argument(
+        "--latency", 
+        help="time each solve, filter, rating, submit and read step and append them to database/latency.jsonl",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--trace", 
+        help="record each game's guesses, patterns and remaining candidates in database/trace_<strategy>_<hash>.bin",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--word-length", 
+        help="letters per word for --offline variants, reads data/words_<length>.txt (default 5)",
+        type=int,
+        default=5
+    )
+    parser.add_argument(
+        "--max-attempts", 
+        help="guesses allowed per game for --offline variants (default 6)",
+        type=int,
+        default=6
+    )
+    parser.add_argument(
+        "--patterns", 
+        help="filter candidates with the precomputed feedback pattern matrix (built on first use)",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--candidates-only", 
+        help="entropy, expected and minimax only score words that can still be the answer (faster, more guesses)",
+        action="store_true"
+    )
     args = parser.parse_args()
+    if not args.offline and (args.word_length, args.max_attempts) != (5, 6):
+        parser.error("the Wordle website only plays 5 letter words in 6 guesses, use --offline for variants")
+    if args.stats is None:
+        args.stats = OFFLINE_STATS_FILE if args.offline else "stats.csv"
 
     return args
 
-def initialize_game_and_stats() -> tuple[WordleSolver, WordleStats]:
-    game = WordleSolver()
-    stats = WordleStats("stats.csv")
+def initialize_game_and_stats(use_patterns: bool = False, strategy: str = "frequency", use_book: bool = False, stats_file: str = "stats.csv", track_latency: bool = False, word_length: int = 5, max_attempts: int = 6, candidates_only: bool = False) -> tuple[WordleSolver, WordleStats]:
+    game = WordleSolver(use_patterns, strategy, use_book=use_book, track_latency=track_latency, word_length=word_length, max_attempts=max_attempts, candidates_only=candidates_only)
+    stats = open_stats(stats_file)
 
     return game, stats
 
 def signal_handler(sig_num, frame):
-    print("INTERRUPT Signal received. Shutting down web driver.")
+    print("INTERRUPT Signal received. Saving stats and shutting down web driver.")
+    stats_writer.flush() # results still buffered would be lost on exit
+    if driver_pool:
+        driver_pool.close() # quits the session in use too, so release() below won't reload it
     game.close_webdriver()
     sys.exit(0)
 
 if __name__ ==  '__main__':    
     set_working_directory()
-    game, stats = initialize_game_and_stats()
     args = parse_cmd_arguments()
+    game, stats = initialize_game_and_stats(args.patterns, args.strategy, args.book, args.stats, args.latency, args.word_length, args.max_attempts, args.candidates_only)
+    if args.answer:
+        try:
+            args.answer = game.check_answer(args.answer)
+        except ValueError as err:
+            sys.exit(str(err))
 
-    signal.signal(signal.SIGINT, signal_handler)
+    driver_pool = None
+    if args.games > 1 and not args.offline:
+        from driver_pool import WebDriverPool
+        driver_pool = WebDriverPool(1, args.browser)
 
-    if args.mode:
-        print(f"---Starting {args.mode} game---")
-        game.startGame(args.mode, args.browser)
-        results: list = game.get_results()
-        stats.save_stats_csv(*results)
-        print("--- Stats saved ---")    
\ No newline at end of file
+    stats_writer = BufferedStatsWriter(stats) # written in batches, flushed on exit and on SIGINT
+    signal.signal(signal.SIGINT, signal_handler)
+    game.verify_guesses = args.verify
+
+    with stats_writer:
+        for _ in range(args.games):
+            print(f"---Starting {args.mode} game---")
+            if args.offline:
+                game.startOfflineGame(args.mode, args.answer)
+            else:
+                game.startGame(args.mode, args.browser, driver_pool)
+            results: list = game.get_results()
+            stats_writer.save_stats_csv(*results)
+            print("--- Stats recorded ---")
+            if args.trace:
+                append_traces(trace_file(book_name(args.strategy, game.patterns is not None, game.candidates_only), game.all_words, game.answers), game.get_trace())
+            if game.latency:
+                game.latency.export(results)
+                print("Latency (ms):", ", ".join(f"{phase} {ms:.1f}" for phase, ms in game.latency.summary().items()))
+    print(f"--- {stats_writer.saved} games saved to {stats_writer.get_file()} ---")
+
+    if args.games > 1:
+        print("Candidate cache:", ", ".join(f"{name} {value:.2f}" if isinstance(value, float) else f"{name} {value}" for name, value in game.candidate_cache.stats().items()))
+
+    if driver_pool:
+        driver_pool.close()    
\ No newline at end of file
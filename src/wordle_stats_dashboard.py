@@ -1,36 +1,154 @@
-from wordle_solver import WordleSolver
-from stats_manager import WordleStats
+from stats_manager import WordleStats, SQLiteStats, open_stats
 
 import streamlit as st
 import pandas as pd
+from pandas.api.types import union_categoricals
 import time
 import altair as alt
 from datetime import datetime
+import io
 import os
+import threading
+
+STATS_COLUMNS = ["date", "game_mode", "answer", "solved", "guesses"]
+CATEGORY_COLUMNS = ["game_mode", "answer"]
+ROLLUP_KEYS = ["date", "game_mode", "solved", "guesses"] # no answer, random answers would make the rollup as large as the raw rows
+REFRESH_SECONDS = 10 # how often the open dashboard checks for new games
+LATENCY_FILE = os.environ.get("WORDLE_LATENCY_FILE", "../database/latency.jsonl") # written by wordle_solver.py --latency
+LATENCY_PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+class StatsLoader:
+    """
+    Keeps the stats DataFrame across Streamlit reruns and only parses rows added since the last load.
+
+    CSV files are tracked by byte offset (and mtime, to catch rewrites), SQLite by the last row id.
+    """
+    def __init__(self, stats_manager: WordleStats):
+        self.stats_manager = stats_manager
+        self.lock = threading.Lock() # sessions rerun concurrently
+        self.offset = 0
+        self.mtime = None
+        self.last_id = 0
+        self.data = self.prepare(pd.DataFrame(columns=STATS_COLUMNS))
+        self.rollup = pd.DataFrame(columns=ROLLUP_KEYS + ["count"]) # game counts per (date, game_mode, solved, guesses)
+
+    def load(self) -> pd.DataFrame:
+        with self.lock:
+            if isinstance(self.stats_manager, SQLiteStats):
+                new_rows = self.read_new_sql_rows()
+            else:
+                new_rows = self.read_new_csv_rows()
+
+            if new_rows is not None and len(new_rows):
+                new_rows = self.prepare(new_rows)
+                self.append(new_rows)
+                self.update_rollup(new_rows)
+            return self.data
+
+    def update_rollup(self, new_rows: pd.DataFrame) -> None:
+        new_counts = rollup_games(new_rows)
+        if len(self.rollup) == 0:
+            self.rollup = new_counts
+        else: # only the new rows are aggregated, then folded into the existing counts
+            self.rollup = pd.concat([self.rollup, new_counts]).groupby(ROLLUP_KEYS, as_index=False)["count"].sum()
+
+    def read_new_sql_rows(self) -> pd.DataFrame:
+        new_rows = pd.read_sql_query(
+            "SELECT id, date, game_mode, answer, solved, guesses FROM games WHERE id > ? ORDER BY id",
+            self.stats_manager.get_connection(),
+            params=(self.last_id,)
+        )
+        if len(new_rows):
+            self.last_id = int(new_rows["id"].iloc[-1])
+        new_rows["solved"] = new_rows["solved"].astype(bool)
+        return new_rows.drop(columns="id")
+
+    def read_new_csv_rows(self) -> pd.DataFrame | None:
+        file_stat = os.stat(self.stats_manager.get_file())
+        if file_stat.st_size < self.offset or (file_stat.st_size == self.offset and file_stat.st_mtime_ns != self.mtime):
+            self.reset() # truncated or rewritten, start over
+
+        if file_stat.st_size == self.offset:
+            return None
+
+        with open(self.stats_manager.get_file(), "rb") as stats_file:
+            stats_file.seek(self.offset)
+            chunk = stats_file.read(file_stat.st_size - self.offset)
+
+        chunk = chunk[:chunk.rfind(b"\n") + 1] # a runner may be mid-write, leave the partial row for next time
+        header_length = chunk.find(b"\n") + 1 if self.offset == 0 and chunk.startswith(b"date;") else 0
+        self.offset += len(chunk)
+        self.mtime = file_stat.st_mtime_ns
+
+        if not chunk[header_length:]:
+            return None
+        return pd.read_csv(io.BytesIO(chunk[header_length:]), sep=";", header=None, names=STATS_COLUMNS)
+
+    def prepare(self, rows: pd.DataFrame) -> pd.DataFrame:
+        rows["date"] = pd.to_datetime(rows["date"])
+        rows["solved"] = rows["solved"].astype(bool)
+        rows["guesses"] = rows["guesses"].astype(int)
+        for column in CATEGORY_COLUMNS:
+            rows[column] = rows[column].astype(str).astype("category")
+        rows.index = pd.DatetimeIndex(rows["date"].values)
+        return rows
+
+    def append(self, rows: pd.DataFrame) -> None:
+        if len(self.data) == 0:
+            self.data = rows
+            return
+        combined = pd.concat([self.data, rows])
+        for column in CATEGORY_COLUMNS: # keep the columns categorical, concat falls back to object when categories differ
+            combined[column] = union_categoricals([self.data[column], rows[column]])
+        self.data = combined
+
+    def reset(self) -> None:
+        self.offset = 0
+        self.last_id = 0
+        self.data = self.prepare(pd.DataFrame(columns=STATS_COLUMNS))
+        self.rollup = pd.DataFrame(columns=ROLLUP_KEYS + ["count"])
+
+def rollup_games(rows: pd.DataFrame) -> pd.DataFrame:
+    rows = rows.astype({column: str for column in CATEGORY_COLUMNS})
+    return rows.groupby(ROLLUP_KEYS, as_index=False).size().rename(columns={"size": "count"})
+
+@st.cache_resource
+def get_stats_loader(stats_file: str, _stats_manager: WordleStats) -> StatsLoader:
+    # one loader per stats file, shared by every session and rerun
+    return StatsLoader(_stats_manager)
+
+@st.cache_data
+def load_latency(latency_file: str, mtime: int) -> pd.DataFrame:
+    # mtime is only part of the cache key, so the file is re-read once it changes
+    return pd.read_json(latency_file, lines=True)
+
+def latency_percentiles(latency: pd.DataFrame) -> pd.DataFrame:
+    phase_ms = latency.groupby("phase")["ms"]
+    percentiles = pd.DataFrame({name: phase_ms.quantile(quantile) for name, quantile in LATENCY_PERCENTILES.items()})
+    percentiles["count"] = phase_ms.size()
+    return percentiles.reset_index() # format as [phase, p50, p90, p99, count]
 
 class WordleDashboard:
-    def __init__(self, wordle_solver: WordleSolver, stats_manager: WordleStats):
+    def __init__(self, stats_manager: WordleStats):
         st.set_page_config(
             page_title="Wordle Solver Stats Dashboard",
             layout="centered",
             initial_sidebar_state="auto",
         )
 
-        self.wordle_solver = wordle_solver
         self.stats_manager = stats_manager
         self.min_date = ""
         self.max_date = ""
         self.raw_data = ""
+        self.rollup = ""
         
         self.load_data()
 
-    # look into caching for performance later (potential issue: cache prevents stats from updating)
-    # also maybe st.fragment for auto reruns indepdently to load new data
+    # cached across reruns, each load only parses games saved since the previous one
     def load_data(self) -> None:
-        data = pd.read_csv(self.stats_manager.get_file(), sep=";", header=0)
-        data["date"] = pd.to_datetime(data["date"])
-
-        self.raw_data = data
+        loader = get_stats_loader(self.stats_manager.get_file(), self.stats_manager)
+        self.raw_data = loader.load()
+        self.rollup = loader.rollup
         self.update_minMax_date()
 
     def data_empty(self) -> bool:
@@ -40,8 +158,11 @@ class WordleDashboard:
         return False
 
     def update_minMax_date(self) -> None:
-        self.min_date = self.raw_data["date"].dt.date.min()
-        self.max_date = self.raw_data["date"].dt.date.max()
+        self.min_date = self.rollup["date"].min().date() if len(self.rollup) else None
+        self.max_date = self.rollup["date"].max().date() if len(self.rollup) else None
+
+    def get_game_modes(self) -> list:
+        return sorted(self.rollup["game_mode"].unique().tolist())
     
     def get_filter(self, game_mode: str, date: str = None, solved: bool = None, date_range: tuple[str, str] = None) -> pd.DataFrame:
         filtered_data = self.raw_data.copy()
@@ -67,25 +188,48 @@ class WordleDashboard:
             filtered_data = filtered_data[(filtered_data["solved"] == solved)]
 
         return filtered_data
+
+    def get_day(self, game_mode: str, date: str) -> pd.DataFrame:
+        # one day's games, a binary search on the date index while games were saved in date order
+        if self.raw_data.index.is_monotonic_increasing:
+            day = pd.Timestamp(date)
+            rows = self.raw_data.iloc[self.raw_data.index.searchsorted(day):self.raw_data.index.searchsorted(day, side="right")]
+        else:
+            rows = self.raw_data[self.raw_data.index == pd.Timestamp(date)]
+        return rows if game_mode == "all" else rows[rows["game_mode"] == game_mode]
+
+    def get_rollup(self, game_mode: str, date: str = None, solved: bool = None, date_range: tuple[str, str] = None) -> pd.DataFrame:
+        # same filters as get_filter, on the pre-aggregated counts instead of every game
+        mask = pd.Series(True, index=self.rollup.index)
+
+        match game_mode:
+            case "rand" | "auto" | "manual":
+                mask &= self.rollup["game_mode"] == game_mode
+            case "all":
+                pass
+            case _:
+                raise ValueError("Game mode does not exist")
+
+        if date_range:
+            mask &= self.rollup["date"].between(pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1]))
+        elif date:
+            mask &= self.rollup["date"] == pd.Timestamp(date)
+
+        if solved is not None:
+            mask &= self.rollup["solved"] == solved
+
+        return self.rollup[mask]
     
     def show_daily_stats(self):
         if self.data_empty():
             return
         today = datetime.today().strftime("%Y-%m-%d")
-        game_modes: list = self.raw_data["game_mode"].unique().tolist() + ["all"]
-
-        solved_data = {}
-        unsolved_data = {}
-        data = {}
-
-        for mode in game_modes:
-            data[mode] = self.get_filter(game_mode=mode, date=today)
-            solved_data[mode] = self.get_filter(game_mode=mode, date=today, solved=True)
-            unsolved_data[mode] = self.get_filter(game_mode=mode, date=today, solved=False)
+        game_modes: list = self.get_game_modes() + ["all"]
         
         selected_mode = st.selectbox("Select game mode: ", game_modes, key=f"show_daily_stats")
 
-        chart_data = data[selected_mode].groupby(["guesses", "solved", "answer"]).size().reset_index(name="count") # .size needed to compute # of elem per group else return obj and not actual result
+        data = self.get_day(game_mode=selected_mode, date=today) # the rollup has no answers, today's rows are few
+        chart_data = data.groupby(["guesses", "solved", "answer"], as_index=False, observed=True).size().rename(columns={"size": "count"})
 
         alt_chart = (
             alt.Chart(chart_data)
@@ -131,6 +275,7 @@ class WordleDashboard:
                 "Game Mode Distribution": self.show_game_mode_dist,
                 "Guess Distribution": self.show_guess_dist, 
                 "Success Rate": self.show_success_rate,
+                "Latency": self.show_latency,
         }
 
         tab_names = list(tab_options.keys())
@@ -161,7 +306,7 @@ class WordleDashboard:
         if self.data_empty():
             return
         st.subheader("Game Mode Distribution")
-        game_mode_counts = self.raw_data["game_mode"].value_counts() # index = list[game modes] , values = list[counts]
+        game_mode_counts = self.rollup.groupby("game_mode")["count"].sum().sort_values(ascending=False) # index = list[game modes] , values = list[counts]
         
         modes = game_mode_counts.index.tolist()
         counts = game_mode_counts.values.tolist()
@@ -186,15 +331,12 @@ class WordleDashboard:
             return
         st.subheader("Total Guess Distribution")
 
-        data = {}
-        game_modes: list = self.raw_data["game_mode"].unique().tolist() + ["all"]
-
-        for mode in game_modes:
-            data[mode] = self.get_filter(game_mode=mode)
+        game_modes: list = self.get_game_modes() + ["all"]
         
         selected_mode = st.selectbox("Select game mode:", game_modes, key=f"show_guess_dist")
 
-        chart_data = data[selected_mode].groupby(["guesses", "solved"]).size().reset_index(name="count")
+        data = self.get_rollup(game_mode=selected_mode)
+        chart_data = data.groupby(["guesses", "solved"], as_index=False)["count"].sum()
 
         alt_chart = (
             alt.Chart(chart_data)
@@ -214,7 +356,7 @@ class WordleDashboard:
         st.subheader("Success Rate")
 
         mode_success_rates = {}
-        game_modes: list = self.raw_data["game_mode"].unique().tolist()
+        game_modes: list = self.get_game_modes()
         # displays sr for different modes and time peroids using astair graph
         
         selected_dates = st.date_input(
@@ -229,7 +371,7 @@ class WordleDashboard:
         selected_end_date = selected_dates[1].strftime("%Y-%m-%d") if len(selected_dates) == 2 else selected_start_date
         
         for mode in game_modes:
-            filtered_data = self.get_filter(game_mode=mode, date_range=(selected_start_date, selected_end_date))
+            filtered_data = self.get_rollup(game_mode=mode, date_range=(selected_start_date, selected_end_date))
             mode_success_rates[mode] = filtered_data
 
         success_rates = {}
@@ -249,22 +391,59 @@ class WordleDashboard:
             
         st.altair_chart(altair_chart=alt_chart, use_container_width=True)
     
+    def show_latency(self):
+        st.subheader("Latency")
+        if not os.path.exists(LATENCY_FILE) or os.path.getsize(LATENCY_FILE) == 0:
+            st.warning("No latency data available. Play games with the --latency flag to record it.")
+            return
+
+        latency = load_latency(LATENCY_FILE, os.stat(LATENCY_FILE).st_mtime_ns)
+        game_modes: list = sorted(latency["game_mode"].unique().tolist()) + ["all"]
+        selected_mode = st.selectbox("Select game mode:", game_modes, key=f"show_latency")
+        if selected_mode != "all":
+            latency = latency[latency["game_mode"] == selected_mode]
+
+        percentiles = latency_percentiles(latency)
+        st.dataframe(percentiles, hide_index=True, use_container_width=True)
+
+        chart_data = percentiles.melt(id_vars="phase", value_vars=list(LATENCY_PERCENTILES), var_name="percentile", value_name="ms")
+        alt_chart = (
+            alt.Chart(chart_data)
+            .mark_bar()
+            .encode(
+                alt.X("phase:N", title="Phase", axis=alt.Axis(labelAngle=0)),
+                alt.Y("ms:Q", title="Milliseconds"),
+                alt.XOffset("percentile:N"),
+                alt.Color("percentile:N"),
+                tooltip=["phase", "percentile", "ms"],
+            )
+        )
+
+        st.altair_chart(altair_chart=alt_chart, use_container_width=True)
+
     def calculate_success_rate(self, data_set: pd.DataFrame) -> int:
         # NOT CONVERTING TO 100 BC SHOW_SUCCESS_RATE ALT CHAR Y AXIS EXPECTS NUMERIC VALUE AND AUTO TRANSFORMS TO % 
-        success: int = len(data_set[(data_set["solved"] == True)])
-        fails: int = len(data_set[(data_set["solved"] == False)])
+        # rollups carry a count per row, raw game rows count once each
+        game_counts = data_set["count"] if "count" in data_set else pd.Series(1, index=data_set.index)
+        success: int = game_counts[(data_set["solved"] == True)].sum()
+        fails: int = game_counts[(data_set["solved"] == False)].sum()
         total: int = success + fails
 
         return round((success / total), 2) if total != 0 else 0
         
     
 def run_app() -> None:
-    game = WordleSolver() # no param sets it to "auto"
-    stats = WordleStats("stats.csv")
-    dashboard = WordleDashboard(game, stats)
+    stats = open_stats(os.environ.get("WORDLE_STATS_FILE", "stats.csv"))
+    dashboard = WordleDashboard(stats)
 
     st.title("Wordle Solver Stats Dashboard")
 
+    show_live_tabs(dashboard)
+
+@st.experimental_fragment(run_every=REFRESH_SECONDS)
+def show_live_tabs(dashboard: WordleDashboard) -> None:
+    # reruns on its own so new games show up without a manual refresh
+    dashboard.load_data()
     dashboard.display_tabs_refreshed()
 
 def set_working_directory() -> None:
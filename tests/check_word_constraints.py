@@ -0,0 +1,59 @@
+import random
+import sys
+
+sys.path.append("../")
+
+import numpy as np
+
+from src.feedback_oracle import FeedbackOracle
+from src.pattern_matrix import compute_patterns, encode_words, states_from_pattern
+from src.word_constraints import WordConstraints, encode_word
+from src.word_store import load_word_lists
+
+# Regression check: the letter filters (WordConstraints) must keep exactly the answers
+# the feedback patterns (compute_patterns) agree with, repeated letters included.
+# Run from this directory: python check_word_constraints.py [pairs] [seed]
+
+
+def check_pair(guess: str, answer: str, answers: tuple[str, ...], answer_codes: np.ndarray, word_codes: dict) -> list[str]:
+    """
+    Compare both filters for one (answer, guess) pair.
+
+    Returns:
+    - problems: A description of every disagreement, empty if they agree.
+    """
+    pattern = int(compute_patterns(encode_words([guess]), encode_words([answer]))[0, 0])
+    letter_states = states_from_pattern(pattern, len(guess))
+    problems = []
+    if FeedbackOracle(answer).score_guess(guess) != letter_states:
+        problems.append(f"{guess} -> {answer}: oracle scored {FeedbackOracle(answer).score_guess(guess)}, pattern gives {letter_states}")
+
+    constraints = WordConstraints(len(guess))
+    constraints.add_feedback(guess, letter_states)
+    kept = set(constraints.filter(answers, word_codes))
+    expected = {answers[index] for index in np.flatnonzero(compute_patterns(encode_words([guess]), answer_codes)[0] == pattern)}
+    if kept != expected:
+        problems.append(
+            f"{guess} -> {answer}: constraints kept {sorted(kept - expected)[:5]} extra, dropped {sorted(expected - kept)[:5]}"
+        )
+    return problems
+
+
+if __name__ == "__main__":
+    pair_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+
+    guesses, answers = load_word_lists()
+    answer_codes = encode_words(answers)
+    word_codes = {word: encode_word(word) for word in answers}
+    repeated_guesses = [word for word in guesses if len(set(word)) < len(word)] # the cases most likely to disagree
+
+    problems = []
+    for _ in range(pair_count):
+        guess = rng.choice(repeated_guesses if rng.random() < 0.5 else guesses)
+        problems += check_pair(guess, rng.choice(answers), answers, answer_codes, word_codes)
+
+    for problem in problems[:20]:
+        print(problem)
+    print(f"--- {pair_count} pairs checked, {len(problems)} disagreements ---")
+    sys.exit(1 if problems else 0)
@@ -4,14 +4,17 @@ sys.path.append("../")
 
 from src.wordle_solver import WordleSolver
 from src.stats_manager import WordleStats
+from src.driver_pool import WebDriverPool
 
 if __name__ == "__main__":
 
     game = WordleSolver() # no param sets it to "auto"
     stats = WordleStats("stats.csv")
+    driver_pool = WebDriverPool(1) # one warm Chrome session reused across games
     for i in range(100):
-        game.startGame("rand")
+        game.startGame("rand", driver_pool=driver_pool)
         results: list = game.get_results()
         print(results)
         stats.save_stats_csv(*results)
-        print("--- Stats saved ---")
\ No newline at end of file
+        print("--- Stats saved ---")
+    driver_pool.close()
\ No newline at end of file